@@ -0,0 +1,232 @@
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+
+MATCH = 'match'
+SUBSTITUTION = 'sub'
+INSERTION = 'ins'
+OMISSION = 'del'
+
+_RESYNC_OFFSETS: Dict[int, List] = {}
+
+
+class TokenVocabulary:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def intern(self, word: str) -> int:
+        token_id = self.ids.get(word)
+        if token_id is None:
+            token_id = len(self.ids)
+            self.ids[word] = token_id
+        return token_id
+
+    def encode(self, words: Sequence[str]) -> List[int]:
+        return [self.intern(w) for w in words]
+
+    def lookup(self, words: Sequence[str]) -> List[int]:
+        ids = self.ids
+        return [ids.get(w, -1) for w in words]
+
+
+def _align_block(ref, spoken, ref_start, spoken_start, ops):
+    rows, cols = len(ref), len(spoken)
+    if rows == 0 or cols == 0:
+        ops.extend((OMISSION, ref_start + i, None) for i in range(rows))
+        ops.extend((INSERTION, None, spoken_start + j) for j in range(cols))
+        return
+
+    cost = [[0] * (cols + 1) for _ in range(rows + 1)]
+    for i in range(1, rows + 1):
+        cost[i][0] = i
+    for j in range(1, cols + 1):
+        cost[0][j] = j
+    for i in range(1, rows + 1):
+        prev_row, row, r = cost[i - 1], cost[i], ref[i - 1]
+        for j in range(1, cols + 1):
+            diag = prev_row[j - 1] + (0 if r == spoken[j - 1] else 1)
+            row[j] = min(diag, prev_row[j] + 1, row[j - 1] + 1)
+
+    block_ops = []
+    i, j = rows, cols
+    while i > 0 or j > 0:
+        if i > 0 and j > 0:
+            same = ref[i - 1] == spoken[j - 1]
+            if cost[i][j] == cost[i - 1][j - 1] + (0 if same else 1):
+                block_ops.append((MATCH if same else SUBSTITUTION, ref_start + i - 1, spoken_start + j - 1))
+                i -= 1
+                j -= 1
+                continue
+        if i > 0 and cost[i][j] == cost[i - 1][j] + 1:
+            block_ops.append((OMISSION, ref_start + i - 1, None))
+            i -= 1
+        else:
+            block_ops.append((INSERTION, None, spoken_start + j - 1))
+            j -= 1
+    block_ops.reverse()
+    ops.extend(block_ops)
+
+
+def _resync_offsets(band):
+    offsets = _RESYNC_OFFSETS.get(band)
+    if offsets is None:
+        offsets = [(di, distance - di)
+                   for distance in range(1, 2 * band + 1)
+                   for di in sorted(range(distance + 1), key=lambda d: abs(2 * d - distance))
+                   if di <= band and distance - di <= band]
+        _RESYNC_OFFSETS[band] = offsets
+    return offsets
+
+
+def _find_resync(ref_ids, spoken_ids, i, j, band, anchor):
+    n, m = len(ref_ids), len(spoken_ids)
+    candidate = None
+    for di, dj in _resync_offsets(band):
+        ri, sj = i + di, j + dj
+        if ri >= n or sj >= m:
+            continue
+        k = 0
+        while k <= anchor and ri + k < n and sj + k < m and ref_ids[ri + k] == spoken_ids[sj + k]:
+            k += 1
+        if k > anchor or (k > 0 and (ri + k == n or sj + k == m)):
+            return di, dj
+        if k == anchor and candidate is None:
+            candidate = (di, dj)
+    return candidate
+
+
+def _align_window(ref_ids, spoken_ids, i, j, band, ops):
+    block = []
+    _align_block(ref_ids[i:i + 2 * band], spoken_ids[j:j + 2 * band], i, j, block)
+    last = None
+    for k, (op, ref_index, spoken_index) in enumerate(block):
+        if op == MATCH:
+            if ref_index >= i + band or spoken_index >= j + band:
+                break
+            last = k
+    if last is None:
+        return None
+    ops.extend(block[:last + 1])
+    return block[last][1] + 1, block[last][2] + 1
+
+
+def _ngrams(ids, size):
+    return list(zip(*(ids[k:] for k in range(size))))
+
+
+def _anchor_index(ref_ids, spoken_ids, size):
+    ref_grams = _ngrams(ref_ids, size)
+    counts = Counter(ref_grams)
+    unique = {gram: k for k, gram in enumerate(ref_grams) if counts[gram] == 1}
+
+    spoken_hits, spoken_refs = [], []
+    spoken_grams: Dict[tuple, List[int]] = {}
+    for k, gram in enumerate(_ngrams(spoken_ids, size)):
+        ref_index = unique.get(gram)
+        if ref_index is not None:
+            spoken_hits.append(k)
+            spoken_refs.append(ref_index)
+            spoken_grams.setdefault(gram, []).append(k)
+
+    ref_hits = sorted(unique[gram] for gram in spoken_grams)
+    ref_spoken = [spoken_grams[ref_grams[k]] for k in ref_hits]
+    return spoken_hits, spoken_refs, ref_hits, ref_spoken
+
+
+def _find_anchor(i, j, index, reach):
+    spoken_hits, spoken_refs, ref_hits, ref_spoken = index
+    best: Optional[tuple] = None
+
+    k = bisect_left(spoken_hits, j)
+    while k < len(spoken_hits):
+        dj = spoken_hits[k] - j
+        if dj >= reach or (best is not None and dj >= best[0] + best[1]):
+            break
+        di = spoken_refs[k] - i
+        if 0 <= di < reach and (best is None or di + dj < best[0] + best[1]):
+            best = (di, dj)
+        k += 1
+
+    k = bisect_left(ref_hits, i)
+    while k < len(ref_hits):
+        di = ref_hits[k] - i
+        if di >= reach or (best is not None and di >= best[0] + best[1]):
+            break
+        positions = ref_spoken[k]
+        p = bisect_left(positions, j)
+        dj = positions[p] - j if p < len(positions) else reach
+        if dj < reach and (best is None or di + dj < best[0] + best[1]):
+            best = (di, dj)
+        k += 1
+    return best
+
+
+def align_words(ref_ids: Sequence[int], spoken_ids: Sequence[int], band: int = 16, anchor: int = 2,
+                reach: int = 2000):
+    n, m = len(ref_ids), len(spoken_ids)
+    ops = []
+    i = j = 0
+    anchors = None
+    global_from = 0
+
+    while i < n and j < m:
+        if ref_ids[i] == spoken_ids[j]:
+            ops.append((MATCH, i, j))
+            i += 1
+            j += 1
+            continue
+
+        resync = _find_resync(ref_ids, spoken_ids, i, j, band, anchor)
+        if resync is None or resync[0] + resync[1] > 2:
+            found = None
+            if j >= global_from:
+                if anchors is None:
+                    anchors = _anchor_index(ref_ids, spoken_ids, anchor + 1)
+                found = _find_anchor(i, j, anchors, reach if resync is None else 4 * band)
+                if found is None and resync is None:
+                    global_from = j + band
+            if found is None and resync is not None:
+                aligned = _align_window(ref_ids, spoken_ids, i, j, band, ops)
+                if aligned is not None:
+                    i, j = aligned
+                    continue
+                resync = None
+            elif found is not None:
+                resync = found
+        if resync is None:
+            ops.append((SUBSTITUTION, i, j))
+            i += 1
+            j += 1
+            continue
+
+        di, dj = resync
+        _align_block(ref_ids[i:i + di], spoken_ids[j:j + dj], i, j, ops)
+        i += di
+        j += dj
+
+    _align_block(ref_ids[i:n], spoken_ids[j:m], i, j, ops)
+    return summarize_alignment(ops, n)
+
+
+def summarize_alignment(ops, ref_length: int):
+    matches = 0
+    substitutions, insertions, omissions = [], [], []
+    for op, ref_index, spoken_index in ops:
+        if op == MATCH:
+            matches += 1
+        elif op == SUBSTITUTION:
+            substitutions.append((ref_index, spoken_index))
+        elif op == INSERTION:
+            insertions.append(spoken_index)
+        else:
+            omissions.append(ref_index)
+
+    return {
+        'ops': ops,
+        'matches': matches,
+        'substitutions': substitutions,
+        'insertions': insertions,
+        'omissions': omissions,
+        'accuracy': (matches / ref_length) * 100 if ref_length else 0.0
+    }
@@ -0,0 +1,278 @@
+import argparse
+import json
+import os
+import threading
+import time
+import uuid
+import wave
+from collections import deque
+from typing import List, Optional
+
+import numpy as np
+
+
+class SessionWriter:
+    def __init__(self, directory: str, metadata: dict, rate: int, chunk_samples: int):
+        self.path = os.path.join(directory, metadata['session_id'])
+        os.makedirs(self.path, exist_ok=True)
+        self.rate = rate
+        self.chunk_samples = chunk_samples
+        self.index = dict(metadata, rate=rate, chunks=[], samples=0, segments='segments.jsonl',
+                          started_at=time.time())
+        self._segments = open(os.path.join(self.path, 'segments.jsonl'), 'a', encoding='utf-8')
+        self._wav = None
+        self._chunk_filled = 0
+        self._write_index()
+
+    def write(self, samples: np.ndarray):
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+        while len(pcm):
+            if self._wav is None:
+                name = f"audio_{len(self.index['chunks']):04d}.wav"
+                self._wav = wave.open(os.path.join(self.path, name), 'wb')
+                self._wav.setnchannels(1)
+                self._wav.setsampwidth(2)
+                self._wav.setframerate(self.rate)
+                self.index['chunks'].append({'file': name, 'start': round(self.index['samples'] / self.rate, 3)})
+                self._write_index()
+            take = min(len(pcm), self.chunk_samples - self._chunk_filled)
+            self._wav.writeframes(pcm[:take].tobytes())
+            pcm = pcm[take:]
+            self._chunk_filled += take
+            self.index['samples'] += take
+            if self._chunk_filled >= self.chunk_samples:
+                self._close_chunk()
+
+    def add_segments(self, segments: List[dict]):
+        for segment in segments:
+            self._segments.write(json.dumps(segment, ensure_ascii=False) + "\n")
+        self._segments.flush()
+
+    def close(self, dropped_samples: int) -> dict:
+        self._close_chunk()
+        self._segments.close()
+        self.index['seconds'] = round(self.index['samples'] / self.rate, 3)
+        self.index['dropped_seconds'] = round(dropped_samples / self.rate, 3)
+        self.index['ended_at'] = time.time()
+        self._write_index()
+        return self.index
+
+    def _close_chunk(self):
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+            self._chunk_filled = 0
+
+    def _write_index(self):
+        temporary = os.path.join(self.path, 'session.json.tmp')
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False)
+        os.replace(temporary, os.path.join(self.path, 'session.json'))
+
+
+class AudioArchive:
+    def __init__(self, directory: str, rate: int = 16000, buffer_seconds: float = 30.0,
+                 chunk_seconds: float = 60.0, flush_seconds: float = 0.5):
+        self.directory = directory
+        self.rate = rate
+        self.capacity = int(buffer_seconds * rate)
+        self.chunk_samples = int(chunk_seconds * rate)
+        self.flush_samples = int(flush_seconds * rate)
+        self.flush_seconds = flush_seconds
+        self.ring = np.zeros(self.capacity, dtype=np.float32)
+        os.makedirs(directory, exist_ok=True)
+
+        self.session_id: Optional[str] = None
+        self.pushed = 0
+        self.consumed = 0
+        self.dropped = 0
+        self.high_water = 0
+        self.sessions = 0
+        self._events = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True, name='audio-archive')
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'AudioArchive':
+        return cls(
+            config['audio_archive'],
+            buffer_seconds=config.get('audio_archive_buffer', 30.0),
+            chunk_seconds=config.get('audio_archive_chunk', 60.0)
+        )
+
+    def begin(self, metadata: Optional[dict] = None) -> str:
+        metadata = dict(metadata or {})
+        session_id = metadata.setdefault('session_id', f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}")
+        with self._cond:
+            if self.session_id is not None:
+                self._events.append((self.pushed, 'end', self.dropped))
+            self.session_id = session_id
+            self.sessions += 1
+            self._events.append((self.pushed, 'begin', (metadata, self.dropped)))
+            self._cond.notify()
+        return session_id
+
+    def end(self):
+        with self._cond:
+            if self.session_id is None:
+                return
+            self.session_id = None
+            self._events.append((self.pushed, 'end', self.dropped))
+            self._cond.notify()
+
+    def add_segments(self, segments: List[dict]):
+        with self._cond:
+            if self.session_id is None:
+                return
+            self._events.append((self.pushed, 'segments', list(segments)))
+
+    def write(self, packet: bytes):
+        if self.session_id is None:
+            return
+        samples = np.frombuffer(packet, dtype=np.float32)
+        with self._cond:
+            if self.session_id is None:
+                return
+            free = self.capacity - (self.pushed - self.consumed)
+            if len(samples) > free:
+                self.dropped += len(samples) - free
+                samples = samples[:free]
+            start = self.pushed % self.capacity
+            first = min(len(samples), self.capacity - start)
+            self.ring[start:start + first] = samples[:first]
+            self.ring[:len(samples) - first] = samples[first:]
+            self.pushed += len(samples)
+            buffered = self.pushed - self.consumed
+            if buffered > self.high_water:
+                self.high_water = buffered
+            if buffered >= self.flush_samples:
+                self._cond.notify()
+
+    def stats(self) -> dict:
+        with self._cond:
+            buffered = self.pushed - self.consumed
+            return {
+                'sessions': self.sessions,
+                'buffered_seconds': round(buffered / self.rate, 3),
+                'fill_ratio': round(buffered / self.capacity, 4),
+                'high_water_ratio': round(self.high_water / self.capacity, 4),
+                'archived_seconds': round(self.consumed / self.rate, 3),
+                'dropped_seconds': round(self.dropped / self.rate, 3)
+            }
+
+    def close(self, timeout: Optional[float] = None):
+        self.end()
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _take(self, limit: int) -> Optional[np.ndarray]:
+        if limit <= self.consumed:
+            return None
+        start, count = self.consumed % self.capacity, limit - self.consumed
+        first = min(count, self.capacity - start)
+        audio = np.concatenate((self.ring[start:start + first], self.ring[:count - first]))
+        self.consumed = limit
+        return audio
+
+    def _run(self):
+        writer = None
+        dropped_at_start = 0
+        while True:
+            with self._cond:
+                if not self._closed and not self._events and self.pushed - self.consumed < self.flush_samples:
+                    self._cond.wait(self.flush_seconds)
+                audio = self._take(self._events[0][0] if self._events else self.pushed)
+                event = self._events.popleft() if self._events and self._events[0][0] <= self.consumed else None
+                finished = self._closed and not self._events and self.pushed == self.consumed
+
+            if audio is not None and writer is not None:
+                writer.write(audio)
+            if event is not None:
+                _, kind, payload = event
+                if kind == 'begin':
+                    metadata, dropped_at_start = payload
+                    writer = SessionWriter(self.directory, metadata, self.rate, self.chunk_samples)
+                elif kind == 'segments' and writer is not None:
+                    writer.add_segments(payload)
+                elif kind == 'end' and writer is not None:
+                    index = writer.close(payload - dropped_at_start)
+                    self._append_index(index)
+                    writer = None
+            if finished:
+                break
+
+    def _append_index(self, index: dict):
+        entry = {key: value for key, value in index.items() if key not in ('chunks', 'text')}
+        with open(os.path.join(self.directory, 'index.jsonl'), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def load_session(path: str) -> dict:
+    with open(os.path.join(path, 'session.json'), 'r', encoding='utf-8') as f:
+        session = json.load(f)
+    with open(os.path.join(path, session['segments']), 'r', encoding='utf-8') as f:
+        session['segments'] = [json.loads(line) for line in f if line.strip()]
+    session['path'] = path
+    return session
+
+
+def session_audio(path: str) -> str:
+    with open(os.path.join(path, 'session.json'), 'r', encoding='utf-8') as f:
+        session = json.load(f)
+    chunks = [os.path.join(path, chunk['file']) for chunk in session['chunks']]
+    if len(chunks) == 1:
+        return chunks[0]
+    joined = os.path.join(path, 'session.wav')
+    if not os.path.exists(joined):
+        with wave.open(joined + '.tmp', 'wb') as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(session['rate'])
+            for chunk in chunks:
+                with wave.open(chunk, 'rb') as wav:
+                    out.writeframes(wav.readframes(wav.getnframes()))
+        os.replace(joined + '.tmp', joined)
+    return joined
+
+
+def list_sessions(directory: str) -> List[str]:
+    return sorted(entry.path for entry in os.scandir(directory)
+                  if entry.is_dir() and os.path.exists(os.path.join(entry.path, 'session.json')))
+
+
+def reanalyze(path: str) -> dict:
+    from reading_analysis import analyze_reading
+
+    session = load_session(path)
+    return analyze_reading(session['segments'], session.get('text', '').split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect and re-analyse archived reading sessions')
+    commands = parser.add_subparsers(dest='command', required=True)
+    manifest = commands.add_parser('manifest', help='Write a batch_assess manifest for every archived session')
+    manifest.add_argument('archive')
+    manifest.add_argument('-o', '--output', required=True)
+    rescore = commands.add_parser('reanalyze', help='Re-run the analyzer over the stored segments of one session')
+    rescore.add_argument('session')
+    args = parser.parse_args()
+
+    if args.command == 'manifest':
+        with open(args.output, 'w', encoding='utf-8') as out:
+            for path in list_sessions(args.archive):
+                session = load_session(path)
+                if not session['chunks'] or not session.get('text'):
+                    continue
+                entry = {'id': session['session_id'], 'audio': os.path.abspath(session_audio(path)),
+                         'text': session['text']}
+                out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    else:
+        print(json.dumps(reanalyze(args.session), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
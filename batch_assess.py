@@ -0,0 +1,138 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from reading_analysis import analyze_reading
+
+
+def load_manifest(path: str):
+    base_dir = os.path.dirname(os.path.abspath(path))
+    entries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            entry.setdefault('id', str(line_number))
+            entry['audio'] = os.path.join(base_dir, entry['audio'])
+            if 'text' not in entry:
+                with open(os.path.join(base_dir, entry['text_file']), 'r', encoding='utf-8') as text_file:
+                    entry['text'] = text_file.read()
+            entries.append(entry)
+    return entries
+
+
+def transcribe_file(audio_path: str, config: dict):
+    from capture_client import CaptureTranscriptionClient
+
+    segments = []
+
+    def collect(finalized, pending):
+        segments.extend(finalized)
+
+    client = CaptureTranscriptionClient(
+        host=config['host'],
+        port=config['port'],
+        lang=config['lang'],
+        model=config['model'],
+        use_vad=config['use_vad'],
+        client_vad=config.get('client_vad', False),
+        vad_options=config.get('client_vad_options'),
+        word_timestamps=config.get('word_timestamps', True),
+        translate=False,
+        mute_audio_playback=True,
+        text_callback=collect
+    )
+    client.client.disconnect_if_no_response_for = config.get('drain_timeout', 2.0)
+
+    audio_path = os.path.abspath(audio_path)
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='batch_assess_') as scratch:
+        os.chdir(scratch)
+        try:
+            client(audio_path)
+        finally:
+            os.chdir(previous)
+
+    pending = client.client.segment_store.pending
+    if pending and (not segments or pending['start'] >= segments[-1]['end']):
+        segments.append(pending)
+    vad = client.voice_gate.summary() if client.voice_gate is not None else None
+    return segments, vad
+
+
+def assess_session(entry: dict, config: dict):
+    started = time.monotonic()
+    result = {'id': entry['id'], 'audio': entry['audio']}
+    try:
+        segments, vad = transcribe_file(entry['audio'], config)
+        if vad is not None:
+            result['client_vad'] = vad
+        result['analysis'] = analyze_reading(segments, entry['text'].split())
+        result['segments'] = len(segments)
+    except Exception as e:
+        result['error'] = repr(e)
+    result['elapsed'] = round(time.monotonic() - started, 3)
+    return result
+
+
+def run_batch(entries, config: dict, workers: int, output):
+    started = time.monotonic()
+    completed = failed = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(assess_session, entry, config) for entry in entries]
+        for future in as_completed(futures):
+            result = future.result()
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+            output.flush()
+            completed += 1
+            if 'error' in result:
+                failed += 1
+
+    elapsed = time.monotonic() - started
+    return {
+        'sessions': completed,
+        'failed': failed,
+        'elapsed': round(elapsed, 3),
+        'sessions_per_minute': round(completed / (elapsed / 60), 2) if elapsed > 0 else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless batch assessment over recorded readings')
+    parser.add_argument('manifest', help='JSONL file with {"id", "audio", "text" | "text_file"} per line')
+    parser.add_argument('-o', '--output', help='JSON lines output file (default: stdout)')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--config', default='config.json')
+    parser.add_argument('--host')
+    parser.add_argument('--port', type=int)
+    parser.add_argument('--drain-timeout', type=float, default=2.0)
+    args = parser.parse_args()
+
+    with open(args.config, 'r') as f:
+        config = json.load(f)
+    if args.host:
+        config['host'] = args.host
+    if args.port:
+        config['port'] = args.port
+    config['drain_timeout'] = args.drain_timeout
+
+    entries = load_manifest(args.manifest)
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        summary = run_batch(entries, config, max(args.workers, 1), output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(json.dumps(summary), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
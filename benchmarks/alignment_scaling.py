@@ -0,0 +1,62 @@
+import random
+import time
+
+from alignment import TokenVocabulary, align_words
+
+
+WORDS = ("küçük kedi bahçede oyun oynuyor renkli bir kelebek gördü ve peşinden koştu "
+         "ali okula giderken yolda arkadaşı ayşeyi birlikte yürümeye başladılar hava "
+         "çok güzeldi kuşlar ötüyordu").split()
+
+
+def make_session(length: int, error_rate: float = 0.08, seed: int = 0):
+    rng = random.Random(seed)
+    reference = [rng.choice(WORDS) for _ in range(length)]
+    spoken = []
+    for word in reference:
+        roll = rng.random()
+        if roll < error_rate / 3:
+            continue
+        elif roll < 2 * error_rate / 3:
+            spoken.append(word + 'ı')
+        elif roll < error_rate:
+            spoken.extend([word, word])
+        else:
+            spoken.append(word)
+    return reference, spoken
+
+
+def skip_session(length: int, skip: int, seed: int = 0):
+    reference, _ = make_session(length, error_rate=0.0, seed=seed)
+    middle = length // 2
+    if skip >= 0:
+        return reference, reference[:middle] + reference[middle + skip:], length - skip
+    return reference, reference[:middle] + reference[middle + skip:middle] + reference[middle:], length
+
+
+def main():
+    print(f"{'skip':>8} {'seconds':>10} {'accuracy':>10} {'expected':>10}")
+    for skip in (16, 20, 50, 200, -20, -100, -300):
+        reference, spoken, expected = skip_session(1_000, skip)
+        vocabulary = TokenVocabulary()
+        start = time.perf_counter()
+        result = align_words(vocabulary.encode(reference), vocabulary.encode(spoken))
+        elapsed = time.perf_counter() - start
+        print(f"{skip:>8} {elapsed:>10.4f} {result['accuracy']:>9.1f}% {expected / len(reference) * 100:>9.1f}%")
+    print()
+
+    print(f"{'words':>8} {'seconds':>10} {'us/word':>10} {'accuracy':>10}")
+    for length in (1_000, 5_000, 10_000, 25_000, 50_000):
+        reference, spoken = make_session(length)
+        vocabulary = TokenVocabulary()
+        ref_ids = vocabulary.encode(reference)
+        spoken_ids = vocabulary.encode(spoken)
+
+        start = time.perf_counter()
+        result = align_words(ref_ids, spoken_ids)
+        elapsed = time.perf_counter() - start
+        print(f"{length:>8} {elapsed:>10.4f} {elapsed / length * 1e6:>10.2f} {result['accuracy']:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from audio_archive import AudioArchive, load_session, session_audio
+
+
+def run(minutes: float, buffer_seconds: float, speed: float, packet_samples: int = 4096):
+    rng = np.random.default_rng(0)
+    packet = (rng.standard_normal(packet_samples) * 0.1).astype(np.float32).tobytes()
+    packets = int(minutes * 60 * 16000 / packet_samples)
+
+    with tempfile.TemporaryDirectory() as directory:
+        archive = AudioArchive(directory, buffer_seconds=buffer_seconds, chunk_seconds=60.0)
+        archive.begin({'text': 'küçük kedi bahçede'})
+        costs = np.empty(packets)
+        interval = packet_samples / 16000 / speed if speed else 0.0
+        deadline = time.perf_counter()
+        for i in range(packets):
+            started = time.perf_counter()
+            archive.write(packet)
+            costs[i] = time.perf_counter() - started
+            deadline += interval
+            if deadline > started:
+                time.sleep(max(deadline - time.perf_counter(), 0))
+        archive.add_segments([{'start': 0.0, 'end': 1.0, 'text': 'küçük kedi bahçede'}])
+        stats = archive.stats()
+        archive.close()
+
+        path = next(entry.path for entry in os.scandir(directory) if entry.is_dir())
+        session = load_session(path)
+        session_audio(path)
+    return costs, stats, session
+
+
+def main():
+    print(f"{'speed':>6} {'buffer s':>9} {'p50 us':>8} {'p99 us':>8} {'max us':>8} {'high water':>11} "
+          f"{'dropped s':>10} {'archived s':>11} {'chunks':>7}")
+    for speed, buffer_seconds in ((50, 30.0), (200, 30.0), (0, 30.0), (0, 1.0)):
+        costs, stats, session = run(10, buffer_seconds, speed)
+        p50, p99 = np.percentile(costs, (50, 99)) * 1e6
+        print(f"{str(speed) + 'x' if speed else 'max':>6} {buffer_seconds:>9.1f} {p50:>8.1f} {p99:>8.1f} {costs.max() * 1e6:>8.1f} "
+              f"{stats['high_water_ratio'] * 100:>10.1f}% {session['dropped_seconds']:>10.2f} "
+              f"{session['seconds']:>11.1f} {len(session['chunks']):>7}")
+
+
+if __name__ == "__main__":
+    main()
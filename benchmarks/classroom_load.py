@@ -0,0 +1,131 @@
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from classroom import Classroom, StationPool
+from latency_metrics import metrics
+from standin_server import StandInServer
+from benchmarks.alignment_scaling import WORDS
+
+
+def make_script(words, finalize_every: int = 8, word_seconds: float = 0.4):
+    script, finalized = [], []
+    start = 0.0
+    for i in range(0, len(words), finalize_every):
+        chunk = words[i:i + finalize_every]
+        for n in range(1, len(chunk) + 1):
+            pending = {'start': f"{start:.3f}", 'end': f"{start + n * word_seconds:.3f}",
+                       'text': " ".join(chunk[:n]), 'completed': False}
+            script.append((0.0, finalized + [pending]))
+        finalized = finalized + [dict(pending, completed=True)]
+        start += len(chunk) * word_seconds + 0.5
+    script.append((0.0, finalized + [{'start': f"{start:.3f}", 'end': f"{start:.3f}", 'text': '', 'completed': False}]))
+    return script
+
+
+class StandInConnection:
+    def __init__(self, port: int, frame_interval: float):
+        self.port = port
+        self.frame_interval = frame_interval
+        self.ready = threading.Event()
+        self.client = None
+        self._listener = None
+        self._feeding = threading.Event()
+        self._stopped = threading.Event()
+
+    def start(self):
+        from capture_client import CaptureClient
+
+        self.client = CaptureClient(host='localhost', port=self.port, lang='tr', translate=False, model='stand-in',
+                                    use_vad=False, text_callback=self._dispatch, ready_callback=self.ready.set)
+        threading.Thread(target=self._feed, daemon=True).start()
+
+    def wait_ready(self, timeout=None) -> bool:
+        return self.ready.wait(timeout)
+
+    def attach(self, listener):
+        self._listener = listener
+        self._feeding.set()
+
+    def detach(self):
+        self._listener = None
+        self._feeding.clear()
+
+    def _feed(self):
+        packet = np.zeros(4096, dtype=np.float32).tobytes()
+        while not self._stopped.is_set():
+            if not self._feeding.wait(0.1):
+                continue
+            self.client.send_packet_to_server(packet)
+            time.sleep(self.frame_interval)
+
+    def _dispatch(self, finalized, pending):
+        listener = self._listener
+        if listener is not None:
+            listener(finalized, pending)
+
+    def stop(self):
+        self._stopped.set()
+        threading.Thread(target=self.client.close_websocket, daemon=True).start()
+
+
+def run(readers: int, workers: int, words: int, frame_interval: float, timeout: float = 60.0):
+    reference = [WORDS[i % len(WORDS)] for i in range(words)]
+    script = make_script(reference)
+    server = StandInServer(script, host='localhost', port=0, frames_per_message=1)
+    server.start()
+
+    metrics.reset()
+    metrics.enable()
+    pool = StationPool(lambda station: StandInConnection(server.port, frame_interval), range(readers))
+    if not pool.wait_ready(30):
+        raise RuntimeError('stand-in connections did not become ready')
+
+    classroom = Classroom(pool, workers=workers)
+    finished = [threading.Event() for _ in range(readers)]
+    started = time.perf_counter()
+    for station in range(readers):
+        classroom.start(station, reference, on_finished=finished[station].set)
+    deadline = started + timeout
+    unfinished = sum(not event.wait(max(deadline - time.perf_counter(), 0)) for event in finished)
+    elapsed = time.perf_counter() - started
+
+    accuracies = [classroom.stop(station)['accuracy'] for station in range(readers)]
+    classroom.shutdown()
+    server.shutdown()
+    metrics.disable()
+
+    summary = metrics.summary()
+    return {
+        'readers': readers,
+        'workers': workers,
+        'messages': summary['session_queue']['count'],
+        'elapsed': round(elapsed, 3),
+        'messages_per_second': round(summary['session_queue']['count'] / elapsed, 1),
+        'session_queue': summary['session_queue'],
+        'session_drain': summary['session_drain'],
+        'min_accuracy': round(min(accuracies), 2),
+        'unfinished': unfinished
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test classroom mode against the local stand-in server')
+    parser.add_argument('--readers', type=int, nargs='+', default=[1, 10, 20, 40])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--words', type=int, default=80)
+    parser.add_argument('--frame-interval', type=float, default=0.02)
+    args = parser.parse_args()
+
+    print(f"{'readers':>8} {'msgs':>7} {'msg/s':>8} {'queue p50':>10} {'p99 ms':>8} {'drain p99':>10} {'accuracy':>9} {'unfinished':>10}")
+    for readers in args.readers:
+        result = run(readers, args.workers, args.words, args.frame_interval)
+        queue, drain = result['session_queue'], result['session_drain']
+        print(f"{readers:>8} {result['messages']:>7} {result['messages_per_second']:>8} {queue['p50_ms']:>10.2f} "
+              f"{queue['p99_ms']:>8.2f} {drain['p99_ms']:>10.2f} {result['min_accuracy']:>8.1f}% {result['unfinished']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import random
+import time
+
+from fuzzy_match import confidence_tag, edit_distance, similarity
+from benchmarks.alignment_scaling import WORDS
+
+BUDGET_US = 5.0
+SWAPS = {'g': 'ğ', 'i': 'ı', 's': 'ş', 'c': 'ç', 'o': 'ö', 'u': 'ü'}
+
+
+def mutate(word: str, rng: random.Random) -> str:
+    position = rng.randrange(len(word))
+    roll = rng.random()
+    if roll < 0.25:
+        return word[:position] + word[position + 1:]
+    if roll < 0.5:
+        return word[:position] + rng.choice('aeıioöuü') + word[position + 1:]
+    if roll < 0.75:
+        return word[:position] + word[position] + word[position:]
+    return "".join(SWAPS.get(c, c) for c in word)
+
+
+def make_pairs(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        word = rng.choice(WORDS)
+        roll = rng.random()
+        if roll < 0.6:
+            pairs.append((word, word))
+        elif roll < 0.9:
+            pairs.append((word, mutate(word, rng)))
+        else:
+            pairs.append((word, rng.choice(WORDS)))
+    return pairs
+
+
+def reference_distance(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def time_per_call(func, pairs) -> float:
+    start = time.perf_counter()
+    for reference, spoken in pairs:
+        func(reference, spoken)
+    return (time.perf_counter() - start) / len(pairs) * 1e6
+
+
+def main(count: int = 100_000):
+    pairs = make_pairs(count)
+    for reference, spoken in pairs[:2000]:
+        assert edit_distance(reference, spoken) == reference_distance(reference, spoken), (reference, spoken)
+
+    mismatched = [(r, s) for r, s in pairs if r != s]
+    tags = {}
+    for reference, spoken in mismatched:
+        tag = confidence_tag(similarity(reference, spoken))
+        tags[tag] = tags.get(tag, 0) + 1
+
+    mixed = time_per_call(similarity, pairs)
+    worst = time_per_call(similarity, mismatched)
+    bit_parallel = time_per_call(edit_distance, mismatched)
+    dynamic = time_per_call(reference_distance, mismatched[:5000])
+
+    print(f"comparisons: {count} ({len(mismatched)} mismatched)")
+    print(f"similarity, live mix:        {mixed:8.2f} us")
+    print(f"similarity, mismatches only: {worst:8.2f} us")
+    print(f"bit-parallel distance:       {bit_parallel:8.2f} us")
+    print(f"full DP distance:            {dynamic:8.2f} us")
+    print(f"mismatch tags: {tags}")
+    print(f"budget {BUDGET_US} us: {'ok' if worst < BUDGET_US else 'EXCEEDED'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import os
+import random
+import tempfile
+import time
+
+from passage_library import PassageLibrary
+from benchmarks.alignment_scaling import WORDS
+
+TOPICS = ('doğa', 'okul', 'aile', 'hayvanlar', 'spor', 'bilim')
+
+
+def make_passages(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    passages = []
+    for i in range(count):
+        length = rng.randint(20, 400)
+        sentences = [" ".join(rng.choice(WORDS) for _ in range(10)).capitalize() + "." for _ in range(length // 10)]
+        passages.append({
+            'title': f"Metin {i}",
+            'level': rng.randint(1, 6),
+            'topic': rng.choice(TOPICS),
+            'text': " ".join(sentences)
+        })
+    return passages
+
+
+def main(sizes=(100, 1_000, 10_000), samples: int = 200):
+    print(f"{'passages':>9} {'open+page ms':>13} {'page ms':>9} {'cold load ms':>13} {'warm load us':>13}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            path = os.path.join(directory, f"library_{size}.db")
+            library = PassageLibrary(path)
+            library.add_many(make_passages(size))
+            library.close()
+
+            start = time.perf_counter()
+            library = PassageLibrary(path)
+            library.levels()
+            first_page = library.page(9)
+            open_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            after = None
+            for _ in range(samples):
+                page = library.page(9, after, level=3)
+                if len(page) < 9:
+                    after = None
+                else:
+                    last = page[-1]
+                    after = (last['level'], last['word_count'], last['id'])
+            page_time = (time.perf_counter() - start) / samples
+
+            rng = random.Random(1)
+            ids = [rng.randint(1, size) for _ in range(samples)]
+            start = time.perf_counter()
+            for passage_id in ids:
+                library._cache.clear()
+                library.load(passage_id)
+            cold_time = (time.perf_counter() - start) / samples
+
+            library.load(first_page[0]['id'])
+            start = time.perf_counter()
+            for _ in range(samples):
+                library.load(first_page[0]['id'])
+            warm_time = (time.perf_counter() - start) / samples
+
+            library.close()
+            print(f"{size:>9} {open_time * 1e3:>13.2f} {page_time * 1e3:>9.3f} "
+                  f"{cold_time * 1e3:>13.3f} {warm_time * 1e6:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
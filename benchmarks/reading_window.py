@@ -0,0 +1,46 @@
+import random
+import time
+
+from reading_window import ReadingWindow
+from benchmarks.alignment_scaling import WORDS
+
+
+def make_book(words: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    paragraphs, written = [], 0
+    while written < words:
+        size = min(rng.randint(20, 120), words - written)
+        paragraphs.append(" ".join(rng.choice(WORDS) for _ in range(size)))
+        written += size
+    return "\n\n".join(paragraphs)
+
+
+def main(messages: int = 2000):
+    print(f"{'words':>8} {'load ms':>9} {'shown chars':>12} {'render ms':>10} {'update us':>10} {'renders':>8}")
+    for words in (1_000, 10_000, 100_000, 500_000):
+        text = make_book(words)
+        started = time.perf_counter()
+        window = ReadingWindow(text)
+        loaded = time.perf_counter() - started
+
+        shown = window.render(0)
+        render_time, renders, cursor = 0.0, 0, 0
+        started = time.perf_counter()
+        for _ in range(messages):
+            highlights = {cursor + i: 1.0 for i in range(3)}
+            cursor = min(cursor + 3, len(window) - 1)
+            window.update(highlights)
+            if window.needs_render(cursor):
+                render_started = time.perf_counter()
+                shown = window.render(cursor)
+                window.tag_ranges()
+                render_time += time.perf_counter() - render_started
+                renders += 1
+        elapsed = time.perf_counter() - started
+
+        print(f"{words:>8} {loaded * 1e3:>9.1f} {len(shown):>12} {render_time / max(renders, 1) * 1e3:>10.2f} "
+              f"{(elapsed - render_time) / messages * 1e6:>10.1f} {renders:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import random
+import time
+
+from reading_core import build_report
+from benchmarks.alignment_scaling import WORDS
+
+
+def make_analysis(events: int, seed: int = 0):
+    rng = random.Random(seed)
+    hesitations = [{'type': rng.choice(('repetition', 'restart')), 'word': rng.choice(WORDS),
+                    'timestamp': round(i * 1.7, 2)} for i in range(events)]
+    misreadings = []
+    for i in range(events):
+        reference = rng.choice(WORDS)
+        misreadings.append({'spoken': reference[:-1] + rng.choice('aeıiou'), 'reference': reference,
+                            'timestamp': round(i * 2.3, 2)})
+    word_confidence = [{'index': i, 'word': m['reference'], 'spoken': m['spoken'], 'score': 0.8}
+                       for i, m in enumerate(misreadings)]
+    return {
+        'accuracy': 72.5, 'reading_speed': 64.0, 'start_time': 0.0,
+        'hesitations': hesitations, 'misreadings': misreadings,
+        'mispronunciations': [m['spoken'] for m in misreadings], 'word_confidence': word_confidence,
+        'timing': None
+    }
+
+
+def apply_time(report):
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None
+    text = tk.Text(root)
+    started = time.perf_counter()
+    text.insert(tk.END, *report['chunks'])
+    for body in report['sections'].values():
+        text.tag_configure(body, elide=True)
+    root.update_idletasks()
+    elapsed = time.perf_counter() - started
+    root.destroy()
+    return elapsed
+
+
+def main():
+    print(f"{'events':>8} {'build ms':>10} {'lines':>8} {'tk args':>8} {'apply ms':>10}")
+    for events in (10, 100, 1_000, 10_000):
+        analysis = make_analysis(events)
+        started = time.perf_counter()
+        report = build_report(analysis)
+        elapsed = time.perf_counter() - started
+        lines = sum(text.count("\n") for text in report['chunks'][::2])
+        applied = apply_time(report)
+        shown = f"{applied * 1e3:>10.2f}" if applied is not None else f"{'no display':>10}"
+        print(f"{events:>8} {elapsed * 1e3:>10.2f} {lines:>8} {len(report['chunks']):>8} {shown}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+
+from reading_analysis import analyze_reading, detect_stuttering
+from reading_core import build_report, transcript_edit
+from reading_session import ReadingSession
+from reading_window import ReadingWindow
+from benchmarks.alignment_scaling import WORDS
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scaling_baseline.json')
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+VOWELS = 'aeıioöuü'
+
+
+def prolong(word: str) -> str:
+    for i in range(len(word) - 1, -1, -1):
+        if word[i] in VOWELS:
+            return word[:i + 1] + word[i] * 2 + word[i + 1:]
+    return word
+
+
+def make_reading(length: int, seed: int = 0, error_rate: float = 0.12, words_per_segment: int = 10):
+    rng = random.Random(seed)
+    reference = [rng.choice(WORDS) for _ in range(length)]
+    text = "\n\n".join(" ".join(reference[i:i + 60]).capitalize() + "." for i in range(0, length, 60))
+
+    spoken = []
+    for word in reference:
+        roll = rng.random()
+        if roll < error_rate / 6:
+            continue
+        elif roll < 2 * error_rate / 6:
+            spoken.extend((word, word))
+        elif roll < 3 * error_rate / 6:
+            spoken.extend((word[:2], word))
+        elif roll < 4 * error_rate / 6:
+            spoken.append(prolong(word))
+        elif roll < 5 * error_rate / 6:
+            spoken.append(word + 'ı')
+        elif roll < error_rate:
+            spoken.extend(('ııı', word))
+        else:
+            spoken.append(word)
+
+    messages, segments, t = [], [], 0.0
+    for i in range(0, len(spoken), words_per_segment):
+        words = []
+        for word in spoken[i:i + words_per_segment]:
+            duration = rng.uniform(0.2, 0.6)
+            words.append({'word': ' ' + word, 'start': round(t, 3), 'end': round(t + duration, 3)})
+            t += duration + rng.choice((0.05, 0.1, 0.1, 0.3, 0.8, 1.6))
+        for n in range(1, len(words) + 1):
+            messages.append(([], {'start': words[0]['start'], 'end': words[n - 1]['end'],
+                                  'text': " ".join(w['word'].strip() for w in words[:n]), 'completed': False}))
+        segment = {'start': words[0]['start'], 'end': words[-1]['end'],
+                   'text': " ".join(w['word'].strip() for w in words), 'words': words, 'completed': True}
+        segments.append(segment)
+        messages.append(([segment], None))
+    return {'reference': reference, 'text': text, 'segments': segments, 'messages': messages}
+
+
+def stage_analyze(reading):
+    analyze_reading(reading['segments'], reading['reference'])
+
+
+def stage_detect_stuttering(reading):
+    detect_stuttering(reading['segments'])
+
+
+def stage_live_transcript(reading):
+    session = ReadingSession(reading['reference'])
+    for finalized, pending in reading['messages']:
+        session.handle_transcript(finalized, pending)
+
+
+def stage_word_positions(reading):
+    window = ReadingWindow(reading['text'])
+    window.render(0)
+    for index in range(len(window)):
+        window.update({index: 1.0})
+        if window.needs_render(index + 1):
+            window.render(index + 1)
+            window.tag_ranges()
+        window.position(index)
+
+
+def stage_transcript_diff(reading):
+    shown = "..."
+    for _, pending in reading['messages']:
+        if pending is not None:
+            common, added = transcript_edit(shown, pending['text'])
+            shown = shown[:common] + added
+
+
+def stage_report(reading):
+    build_report(reading['analysis'])
+
+
+STAGES = {
+    'analyze_reading': stage_analyze,
+    'detect_stuttering': stage_detect_stuttering,
+    'live_transcript': stage_live_transcript,
+    'word_positions': stage_word_positions,
+    'transcript_diff': stage_transcript_diff,
+    'report': stage_report
+}
+
+
+def measure(stage, reading, min_seconds: float = 0.25, max_repeats: int = 50) -> float:
+    best, spent, repeats = math.inf, 0.0, 0
+    while repeats < max_repeats and (repeats == 0 or spent < min_seconds):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            stage(reading)
+            elapsed = time.perf_counter() - started
+        finally:
+            gc.enable()
+        best, spent, repeats = min(best, elapsed), spent + elapsed, repeats + 1
+    return best
+
+
+def scaling_exponent(sizes, seconds, fit_from: int) -> float:
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds) if n >= fit_from and t > 0]
+    if len(points) < 2:
+        return 0.0
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in points) /
+            sum((x - mean_x) ** 2 for x, _ in points))
+
+
+def run(sizes, stages, fit_from: int) -> dict:
+    timings = {name: [] for name in stages}
+    for size in sizes:
+        reading = make_reading(size)
+        reading['analysis'] = analyze_reading(reading['segments'], reading['reference'])
+        for name in stages:
+            timings[name].append(measure(STAGES[name], reading))
+    return {
+        'sizes': list(sizes),
+        'fit_from': fit_from,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'stages': {
+            name: {'exponent': round(scaling_exponent(sizes, seconds, fit_from), 3),
+                   'seconds': [round(t, 6) for t in seconds]}
+            for name, seconds in timings.items()
+        }
+    }
+
+
+def regressions(result: dict, baseline: dict, exponent_tolerance: float, time_tolerance: float) -> list:
+    found = []
+    for name, measured in result['stages'].items():
+        expected = baseline['stages'].get(name)
+        if expected is None:
+            continue
+        if measured['exponent'] > expected['exponent'] + exponent_tolerance:
+            found.append(f"{name}: scaling exponent {measured['exponent']:.2f} > "
+                         f"baseline {expected['exponent']:.2f} + {exponent_tolerance}")
+        for size, seconds in zip(result['sizes'], measured['seconds']):
+            if size < result['fit_from'] or size not in baseline['sizes']:
+                continue
+            allowed = expected['seconds'][baseline['sizes'].index(size)] * (1 + time_tolerance)
+            if seconds > allowed:
+                found.append(f"{name}: {seconds * 1e3:.1f} ms at {size} words > {allowed * 1e3:.1f} ms allowed")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scaling benchmarks for the analysis and live reading paths')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES))
+    parser.add_argument('--fit-from', type=int, default=1_000)
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save', action='store_true', help='write the measurements as the new baseline')
+    parser.add_argument('--exponent-tolerance', type=float, default=0.2)
+    parser.add_argument('--time-tolerance', type=float, default=1.0,
+                        help='allowed slowdown over the baseline timings, as a fraction')
+    args = parser.parse_args()
+
+    result = run(sorted(args.sizes), args.stages, args.fit_from)
+
+    print(f"{'stage':<20}" + "".join(f"{size:>11}" for size in result['sizes']) + f"{'exponent':>10}")
+    for name, measured in result['stages'].items():
+        print(f"{name:<20}" + "".join(f"{t * 1e3:>9.2f}ms" for t in measured['seconds']) +
+              f"{measured['exponent']:>10.2f}")
+
+    if args.save:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("no baseline to compare against; run with --save to create one")
+        return
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    found = regressions(result, baseline, args.exponent_tolerance, args.time_tolerance)
+    for line in found:
+        print(f"REGRESSION {line}")
+    if found:
+        sys.exit(1)
+    print("no regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
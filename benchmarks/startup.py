@@ -0,0 +1,114 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_FRAME = """
+import time
+started = time.perf_counter()
+import tkinter as tk
+from dyslexia_helper import DyslexiaFrontendApp
+imported = time.perf_counter()
+root = tk.Tk()
+app = DyslexiaFrontendApp(root)
+built = time.perf_counter()
+
+def shown():
+    root.update_idletasks()
+    print(imported - started, built - started, time.perf_counter() - started, flush=True)
+    app.on_closing()
+
+root.after_idle(shown)
+root.mainloop()
+"""
+
+STARTUP_IO = """
+import time
+from reading_core import load_config
+from passage_library import PassageLibrary
+from session_history import SessionHistory
+
+started = time.perf_counter()
+config = load_config()
+loaded = time.perf_counter()
+PassageLibrary(config.get('passage_library', 'passages.db'))
+SessionHistory(config.get('history_db', 'history.db'))
+print(loaded - started, time.perf_counter() - loaded, flush=True)
+"""
+
+
+def run_python(args, directory):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (ROOT, os.environ.get('PYTHONPATH')))))
+    return subprocess.run([sys.executable, *args], cwd=directory, env=env, capture_output=True, text=True)
+
+
+def import_times(module: str, directory: str):
+    result = run_python(['-X', 'importtime', '-c', f'import {module}'], directory)
+    if result.returncode != 0:
+        return None, []
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        rows.append(((len(name) - len(name.lstrip()) - 1) // 2, name.strip(), int(cumulative)))
+    total = rows[-1][2] if rows else 0
+    top_level = sorted(((name, us) for depth, name, us in rows if depth == 1), key=lambda row: -row[1])
+    return total, top_level
+
+
+def first_frame(directory: str, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        result = run_python(['-c', FIRST_FRAME], directory)
+        if result.returncode != 0:
+            return None, result.stderr.strip().splitlines()[-1]
+        samples.append([float(value) for value in result.stdout.split()])
+    return [statistics.median(column) for column in zip(*samples)], None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure import cost and time to first frame of the reading app')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        totals = []
+        for _ in range(args.repeat):
+            total, top_level = import_times('dyslexia_helper', directory)
+            if total is None:
+                print('dyslexia_helper could not be imported')
+                return
+            totals.append(total)
+        print(f"import dyslexia_helper: {statistics.median(totals) / 1e3:8.1f} ms (median of {args.repeat})")
+        for name, us in top_level[:args.top]:
+            print(f"  {name:<28} {us / 1e3:8.1f} ms")
+
+        deferred, _ = import_times('capture_client', directory)
+        if deferred is not None:
+            print(f"deferred capture_client:  {deferred / 1e3:8.1f} ms (loaded in the background)")
+
+        result = run_python(['-c', STARTUP_IO], directory)
+        if result.returncode == 0:
+            config, databases = (float(value) for value in result.stdout.split())
+            print(f"synchronous startup I/O: load_config {config * 1e3:.2f} ms, "
+                  f"passage library and history {databases * 1e3:.1f} ms")
+
+        started = time.perf_counter()
+        frame, error = first_frame(directory, args.repeat)
+        if frame is None:
+            print(f"first frame: skipped ({error})")
+            return
+        imported, built, shown = frame
+        print(f"first frame:  imports {imported * 1e3:.1f} ms, window built {built * 1e3:.1f} ms, "
+              f"shown {shown * 1e3:.1f} ms (process wall {(time.perf_counter() - started) / args.repeat * 1e3:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import random
+import time
+
+from text_positions import build_token_index
+from benchmarks.alignment_scaling import WORDS
+
+
+def make_text(length: int, seed: int = 0):
+    rng = random.Random(seed)
+    lines, line = [], []
+    for _ in range(length):
+        line.append(rng.choice(WORDS))
+        if len(line) == 12:
+            lines.append(" ".join(line))
+            line = []
+    lines.append(" ".join(line))
+    return "\n".join(lines)
+
+
+def scan_position(text_content: str, word_index: int):
+    tokens = text_content.split()
+    word_to_find = tokens[word_index]
+    pos = text_content.find(word_to_find)
+    row = text_content[:pos].count('\n') + 1
+    last_newline_idx = text_content[:pos].rfind('\n')
+    col = pos if last_newline_idx == -1 else pos - (last_newline_idx + 1)
+    return f"{row}.{col}", f"{row}.{col + len(word_to_find)}"
+
+
+def main(length: int = 10_000, samples: int = 500):
+    text = make_text(length)
+    step = max(length // samples, 1)
+
+    start = time.perf_counter()
+    _, positions = build_token_index(text)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for word_index in range(0, length, step):
+        positions[word_index]
+    lookup_time = (time.perf_counter() - start) / samples
+
+    start = time.perf_counter()
+    for word_index in range(0, length, step):
+        scan_position(text, word_index)
+    scan_time = (time.perf_counter() - start) / samples
+
+    print(f"words: {length}")
+    print(f"index build (once):   {build_time * 1e3:10.2f} ms")
+    print(f"indexed lookup:       {lookup_time * 1e6:10.3f} us/word")
+    print(f"full-text scan:       {scan_time * 1e6:10.1f} us/word")
+    print(f"session (all words):  {lookup_time * length * 1e3:10.2f} ms vs {scan_time * length:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
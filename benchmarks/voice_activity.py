@@ -0,0 +1,76 @@
+import os
+import random
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+from voice_activity import VoiceGate, read_wav
+
+RATE = 16000
+
+
+def make_fixture(path: str, words: int = 60, seed: int = 0):
+    rng = random.Random(seed)
+    noise = np.random.default_rng(seed)
+    pieces, onsets, position = [], [], 0
+    for _ in range(words):
+        pause = rng.choice((0.15, 0.3, 0.6, 1.5, 3.0))
+        silence = noise.normal(0, 0.002, int(pause * RATE)).astype(np.float32)
+        length = int(rng.uniform(0.25, 0.7) * RATE)
+        t = np.arange(length) / RATE
+        pitch = rng.uniform(120, 260)
+        voiced = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 5))
+        envelope = np.minimum(1.0, np.minimum(t, t[::-1]) * 40)
+        word = (0.25 * voiced * envelope).astype(np.float32)
+        fricative = noise.normal(0, 0.03, length // 4).astype(np.float32)
+        word[-len(fricative):] += fricative
+
+        position += len(silence)
+        onsets.append((position, length))
+        position += length
+        pieces.extend((silence, word))
+
+    pieces.append(noise.normal(0, 0.002, RATE).astype(np.float32))
+    audio = np.concatenate(pieces)
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes((np.clip(audio, -1, 1) * 32767).astype(np.int16).tobytes())
+    return onsets
+
+
+def main(chunk: int = 4096):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'fixture.wav')
+        onsets = make_fixture(path)
+        samples, rate = read_wav(path)
+
+    gate = VoiceGate(rate)
+    started = time.perf_counter()
+    sent = np.concatenate([gate.filter(samples[i:i + chunk]) for i in range(0, len(samples), chunk)])
+    elapsed = time.perf_counter() - started
+    packets = -(-len(samples) // chunk)
+
+    errors, cursor, missed = [], 0, 0
+    for onset, length in onsets:
+        loud = np.flatnonzero(np.abs(sent[cursor:]) > 0.02)
+        if not len(loud):
+            missed += 1
+            continue
+        found = cursor + int(loud[0])
+        real = gate.timeline.to_real(found / rate)
+        errors.append(abs(real - onset / rate))
+        cursor = found + length
+
+    summary = gate.summary()
+    print(f"audio: {summary['seconds_in']:.1f} s, sent {summary['seconds_out']:.1f} s, {summary['gaps']} gaps")
+    print(f"bytes saved:            {summary['saved_ratio'] * 100:8.1f} %")
+    print(f"gate cost:              {elapsed / packets * 1e6:8.1f} us per {chunk}-sample packet")
+    print(f"onset timestamp error:  {max(errors, default=0) * 1e3:8.2f} ms max over {len(errors)} words, {missed} missed")
+
+
+if __name__ == "__main__":
+    main()
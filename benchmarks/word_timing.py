@@ -0,0 +1,45 @@
+import random
+import time
+
+from alignment import TokenVocabulary, align_words
+from word_timing import WordTimeline, timed_words, timing_report
+from benchmarks.alignment_scaling import make_session
+
+
+def make_segments(spoken, words_per_segment: int = 10, seed: int = 0):
+    rng = random.Random(seed)
+    segments, t = [], 0.0
+    for i in range(0, len(spoken), words_per_segment):
+        words = []
+        for word in spoken[i:i + words_per_segment]:
+            duration = rng.uniform(0.2, 0.6)
+            words.append({'word': ' ' + word, 'start': t, 'end': t + duration})
+            t += duration + rng.choice((0.05, 0.1, 0.1, 0.4, 0.8, 2.0))
+        segments.append({'start': words[0]['start'], 'end': words[-1]['end'],
+                         'text': ' '.join(w['word'].strip() for w in words), 'words': words})
+    return segments
+
+
+def main():
+    print(f"{'words':>8} {'arrays ms':>10} {'timeline ms':>12} {'report ms':>10} {'wcpm':>8} {'pauses':>8}")
+    for length in (1_000, 10_000, 25_000, 50_000):
+        reference, spoken = make_session(length)
+        segments = make_segments(spoken)
+        vocabulary = TokenVocabulary()
+        ops = align_words(vocabulary.encode(reference), vocabulary.encode(spoken))['ops']
+
+        started = time.perf_counter()
+        _, starts, ends = timed_words(segments)
+        converted = time.perf_counter()
+        timeline = WordTimeline.from_alignment(starts, ends, ops)
+        built = time.perf_counter()
+        report = timing_report(timeline, reference)
+        reported = time.perf_counter()
+
+        print(f"{length:>8} {(converted - started) * 1e3:>10.2f} {(built - converted) * 1e3:>12.2f} "
+              f"{(reported - built) * 1e3:>10.2f} {report['correct_words_per_minute']:>8.1f} "
+              f"{report['pauses']['count']:>8}")
+
+
+if __name__ == "__main__":
+    main()
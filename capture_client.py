@@ -1,37 +1,123 @@
 import time
 from whisper_live.client import Client, TranscriptionClient
-from typing import Callable, Optional
+from typing import Callable, List, Optional
+
+from latency_metrics import metrics
+from segment_store import SegmentRecorder, SegmentStore
+from voice_activity import SpeechTimeline, VoiceGate
 
 
 class CaptureClient(Client):
-    def __init__(self, *args, text_callback: Optional[Callable[[str], None]] = None, **kwargs):
+    def __init__(self, *args, text_callback: Optional[Callable[[List[dict], Optional[dict]], None]] = None,
+                 ready_callback: Optional[Callable[[], None]] = None,
+                 max_finalized_segments: int = 500, segment_log: Optional[str] = None,
+                 record_path: Optional[str] = None, **kwargs):
         kwargs['log_transcription'] = False
-        super().__init__(*args, **kwargs)
         self.text_callback = text_callback
-        self.last_text = None
+        self.ready_callback = ready_callback
+        self.ready_notified = False
+        self.segment_store = SegmentStore(max_finalized_segments, segment_log)
+        self.recorder = SegmentRecorder(record_path) if record_path else None
+        self.audio_seconds_sent = 0.0
+        self.timeline: Optional[SpeechTimeline] = None
+        super().__init__(*args, **kwargs)
+        self.transcript = self.segment_store.finalized
+
+    def on_message(self, ws, message):
+        super().on_message(ws, message)
+        if self.recording and not self.ready_notified:
+            self.ready_notified = True
+            if self.ready_callback:
+                self.ready_callback()
+
+    def close_websocket(self):
+        try:
+            super().close_websocket()
+        finally:
+            self.segment_store.close()
+            if self.recorder:
+                self.recorder.close()
 
-    def process_segments(self, segments):
-        current_text = segments[-1]["text"].strip()
+    def process_segments(self, segments, translated=False):
+        if translated:
+            return
+        timed = metrics.enabled
+        if timed:
+            arrived = metrics.current_arrival = metrics.now()
+        if self.timeline is not None:
+            segments = self.timeline.restore(segments)
+        if self.recorder:
+            self.recorder.record(segments)
+        finalized, pending = self.segment_store.update(segments)
+        self.last_segment = segments[-1]
 
-        if current_text != self.last_text:
-            if self.text_callback:
-                self.text_callback(segments)
-            self.last_text = current_text
+        if timed:
+            parsed = metrics.now()
+            metrics.record('process_segments', parsed - arrived)
+            if self.audio_seconds_sent:
+                metrics.record('server_lag', max(self.audio_seconds_sent - float(segments[-1]['end']), 0.0))
 
-        for i, seg in enumerate(segments):
-            if i == len(segments) - 1:
-                self.last_segment = seg
-            elif (self.server_backend == "faster_whisper" and
-                  (not self.transcript or
-                   float(seg['start']) >= float(self.transcript[-1]['end']))):
-                self.transcript.append(seg)
+        if (finalized or pending) and self.text_callback:
+            self.text_callback(finalized, pending)
+            if timed:
+                metrics.record('handle_live_transcript', metrics.now() - parsed)
 
         if self.last_received_segment is None or self.last_received_segment != segments[-1]["text"]:
             self.last_response_received = time.time()
             self.last_received_segment = segments[-1]["text"]
 
 
+def find_input_device(audio, device) -> int:
+    if isinstance(device, int) or str(device).isdigit():
+        return int(device)
+    for index in range(audio.get_device_count()):
+        info = audio.get_device_info_by_index(index)
+        if info.get('maxInputChannels', 0) > 0 and str(device).lower() in info['name'].lower():
+            return index
+    raise OSError(f"Mikrofon bulunamadı: {device}")
+
+
 class CaptureTranscriptionClient(TranscriptionClient):
-    def __init__(self, *args, text_callback: Optional[Callable[[str], None]] = None, **kwargs):
-        self.client = CaptureClient(*args, text_callback=text_callback, **kwargs)
-        super(TranscriptionClient, self).__init__([self.client])
+    def __init__(self, *args, text_callback: Optional[Callable[[List[dict], Optional[dict]], None]] = None,
+                 ready_callback: Optional[Callable[[], None]] = None, client_vad: bool = False,
+                 vad_options: Optional[dict] = None, archive=None, input_device=None, **kwargs):
+        mute_audio_playback = kwargs.pop('mute_audio_playback', False)
+        self.client = CaptureClient(*args, text_callback=text_callback, ready_callback=ready_callback, **kwargs)
+        self.paused = False
+        self.voice_gate = VoiceGate(**(vad_options or {})) if client_vad else None
+        self.archive = archive
+        if self.voice_gate is not None:
+            self.client.timeline = self.voice_gate.timeline
+        super(TranscriptionClient, self).__init__([self.client], mute_audio_playback=mute_audio_playback)
+        if input_device is not None:
+            try:
+                self.open_input(input_device)
+            except Exception:
+                self.client.close_websocket()
+                raise
+
+    def open_input(self, device):
+        if self.stream is not None:
+            self.stream.close()
+        self.stream = self.p.open(format=self.format, channels=self.channels, rate=self.rate, input=True,
+                                  frames_per_buffer=self.chunk, input_device_index=find_input_device(self.p, device))
+
+    def multicast_packet(self, packet, unconditional=False):
+        if unconditional:
+            super().multicast_packet(packet, unconditional)
+            return
+        if self.paused:
+            return
+        self.client.audio_seconds_sent += len(packet) / (4 * self.rate)
+        captured = packet
+        if self.voice_gate is not None:
+            packet = self.voice_gate.filter_bytes(packet)
+        if packet:
+            super().multicast_packet(packet, unconditional)
+        if self.archive is not None:
+            if metrics.enabled:
+                started = metrics.now()
+                self.archive.write(captured)
+                metrics.record('archive_write', metrics.now() - started)
+            else:
+                self.archive.write(captured)
@@ -0,0 +1,101 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, List, Optional, Sequence
+
+from reading_session import ReadingSession
+
+
+class StationPool:
+    def __init__(self, factory: Callable[[Hashable], object], stations: Sequence[Hashable]):
+        self.connections: Dict[Hashable, object] = {station: factory(station) for station in stations}
+        self._busy = set()
+        self._cond = threading.Condition()
+        for connection in self.connections.values():
+            connection.start()
+
+    @classmethod
+    def from_config(cls, config: dict, stations: Optional[Sequence[dict]] = None) -> 'StationPool':
+        from connection_manager import ConnectionManager
+
+        stations = {str(station['id']): station for station in (stations or config.get('stations', []))}
+
+        def factory(station_id):
+            station = stations[station_id]
+            return ConnectionManager(dict(config, input_device=station.get('input_device')))
+        return cls(factory, list(stations))
+
+    def acquire(self, station: Hashable, timeout: Optional[float] = None):
+        with self._cond:
+            if station not in self.connections:
+                return None
+            if not self._cond.wait_for(lambda: station not in self._busy, timeout):
+                return None
+            self._busy.add(station)
+            return self.connections[station]
+
+    def release(self, station: Hashable):
+        connection = self.connections[station]
+        connection.detach()
+        with self._cond:
+            self._busy.discard(station)
+            self._cond.notify_all()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        return all(connection.wait_ready(timeout) for connection in self.connections.values())
+
+    def close(self):
+        for connection in self.connections.values():
+            connection.stop()
+
+
+class Classroom:
+    def __init__(self, pool: StationPool, workers: int = 4):
+        self.pool = pool
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='classroom')
+        self.sessions: Dict[Hashable, ReadingSession] = {}
+        self._connections: Dict[Hashable, object] = {}
+        self._drains: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def start(self, station: Hashable, reference_words: Sequence[str], timeout: Optional[float] = None,
+              **session_options) -> Optional[ReadingSession]:
+        connection = self.pool.acquire(station, timeout)
+        if connection is None:
+            return None
+        session = ReadingSession(reference_words, **session_options)
+        with self._lock:
+            self.sessions[station] = session
+            self._connections[station] = connection
+        connection.attach(self.listener(station, session))
+        return session
+
+    def listener(self, station: Hashable, session: ReadingSession):
+        def on_transcript(finalized, pending):
+            if session.submit(finalized, pending):
+                self._drains[station] = self.executor.submit(session.drain)
+        return on_transcript
+
+    def stop(self, station: Hashable) -> Optional[dict]:
+        with self._lock:
+            session = self.sessions.pop(station, None)
+            connection = self._connections.pop(station, None)
+        if connection is not None:
+            self.pool.release(station)
+        if session is None:
+            return None
+        drain = self._drains.pop(station, None)
+        if drain is not None:
+            drain.result()
+        if session.submit([], None):
+            session.drain()
+        return session.analyze()
+
+    def active(self) -> List[Hashable]:
+        with self._lock:
+            return list(self.sessions)
+
+    def shutdown(self):
+        for station in self.active():
+            self.stop(station)
+        self.executor.shutdown(wait=True)
+        self.pool.close()
@@ -0,0 +1,202 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from latency_metrics import metrics
+
+
+class ConnectionManager:
+    def __init__(self, config: dict, initial_backoff: float = 1.0, max_backoff: float = 30.0):
+        self.config = config
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self.client = None
+        self.ready = threading.Event()
+        self.error: Optional[str] = None
+        self._state = threading.Condition()
+
+        self._listener: Optional[Callable[[list, Optional[dict]], None]] = None
+        self._session_offset = 0.0
+        self._last_end = 0.0
+        self._time_base = 0.0
+        self._connect_started = 0.0
+        self._session_requested = 0.0
+        self._connections = 0
+        self._stopped = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.archive = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._wakeup.set()
+        self._close_client()
+        if self.archive is not None:
+            self.archive.close()
+
+    def restart(self):
+        with self._state:
+            self.error = None
+        self._wakeup.set()
+        self._close_client()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        with self._state:
+            self._state.wait_for(lambda: self.ready.is_set() or self.error is not None, timeout)
+        return self.ready.is_set()
+
+    def attach(self, listener: Callable[[list, Optional[dict]], None], session: Optional[dict] = None):
+        self._session_offset = self._last_end
+        client = self.client
+        if self.archive is not None:
+            audio_offset = self._time_base
+            if client and client.client:
+                audio_offset += client.client.audio_seconds_sent
+            self.archive.begin(dict(session or {}, audio_offset=round(audio_offset, 3)))
+        self._listener = listener
+        self._session_requested = time.monotonic()
+        if self.ready.is_set() and metrics.enabled:
+            metrics.record('session_start', 0.0)
+        if client:
+            client.paused = False
+
+    def detach(self):
+        self._listener = None
+        client = self.client
+        if client:
+            client.paused = True
+        if self.archive is not None:
+            pending = client.client.segment_store.pending if client and client.client else None
+            if pending is not None:
+                pending = self._shift(pending)
+            if pending is not None and pending['text'].strip() and pending['end'] > self._session_offset:
+                self.archive.add_segments([pending])
+            self.archive.end()
+
+    def _run(self):
+        from capture_client import CaptureTranscriptionClient
+
+        if self.archive is None and self.config.get('audio_archive'):
+            from audio_archive import AudioArchive
+            self.archive = AudioArchive.from_config(self.config)
+
+        backoff = self.initial_backoff
+        while not self._stopped.is_set():
+            self._connect_started = time.monotonic()
+            try:
+                self.client = CaptureTranscriptionClient(
+                    host=self.config['host'],
+                    port=self.config['port'],
+                    lang=self.config['lang'],
+                    model=self.config['model'],
+                    use_vad=self.config['use_vad'],
+                    client_vad=self.config.get('client_vad', False),
+                    vad_options=self.config.get('client_vad_options'),
+                    word_timestamps=self.config.get('word_timestamps', True),
+                    translate=False,
+                    text_callback=self._dispatch,
+                    ready_callback=self._on_ready,
+                    segment_log=self.config.get('segment_log'),
+                    record_path=self.config.get('record_segments'),
+                    archive=self.archive,
+                    input_device=self.config.get('input_device')
+                )
+                if self.client.stream is None:
+                    raise OSError('Mikrofon bulunamadı')
+                self.client.paused = self._listener is None
+                self.client()
+                if self.client.client.server_error:
+                    raise ConnectionError(getattr(self.client.client, 'error_message', None) or 'Sunucu hata bildirdi')
+            except Exception as e:
+                if not (self._stopped.is_set() or self._wakeup.is_set()):
+                    self._fail(e)
+
+            was_ready = self.ready.is_set()
+            with self._state:
+                self.ready.clear()
+            self._close_client()
+            self._end_connection()
+            self.client = None
+
+            if was_ready:
+                backoff = self.initial_backoff
+            if self._wakeup.is_set():
+                self._wakeup.clear()
+                continue
+            self._wakeup.wait(backoff)
+            self._wakeup.clear()
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _on_ready(self):
+        now = time.monotonic()
+        if metrics.enabled:
+            metrics.record('connect_cold' if self._connections == 0 else 'connect_reconnect',
+                           now - self._connect_started)
+            if self._listener is not None:
+                metrics.record('session_start', now - self._session_requested)
+        self._connections += 1
+        with self._state:
+            self.error = None
+            self.ready.set()
+            self._state.notify_all()
+
+    def _fail(self, error: Exception):
+        message = str(error) or type(error).__name__
+        with self._state:
+            self.error = message
+            self._state.notify_all()
+
+    def _end_connection(self):
+        client = self.client.client if self.client else None
+        if client is None:
+            return
+        pending = client.segment_store.pending
+        client.segment_store.pending = None
+        if pending is not None and pending['text'].strip():
+            self._dispatch([pending], None)
+        self._time_base = max(self._time_base + client.audio_seconds_sent, self._last_end)
+
+    def _shift(self, segment: dict) -> dict:
+        base = self._time_base
+        if not base:
+            return segment
+        shifted = dict(segment, start=segment['start'] + base, end=segment['end'] + base)
+        if segment.get('words'):
+            shifted['words'] = [dict(w, start=float(w['start']) + base, end=float(w['end']) + base)
+                                for w in segment['words']]
+        return shifted
+
+    def _dispatch(self, finalized, pending):
+        if self._time_base:
+            finalized = [self._shift(s) for s in finalized]
+            if pending is not None:
+                pending = self._shift(pending)
+        latest = pending or finalized[-1]
+        self._last_end = max(self._last_end, latest['end'])
+        listener = self._listener
+        if listener is None:
+            return
+        offset = self._session_offset
+        finalized = [s for s in finalized if s['end'] > offset]
+        if pending is not None and pending['end'] <= offset:
+            pending = None
+        if finalized and self.archive is not None:
+            self.archive.add_segments(finalized)
+        if finalized or pending:
+            listener(finalized, pending)
+
+    def _close_client(self):
+        client = self.client
+        if client and client.client:
+            try:
+                client.client.close_websocket()
+            except Exception:
+                pass
@@ -0,0 +1,134 @@
+import re
+from collections import deque
+from typing import Iterable, List, Optional, Sequence
+
+from normalization import turkish_lower
+
+_PUNCTUATION_RE = re.compile(r'[^\w\s-]')
+_PROLONGATION_RE = re.compile(r'([aeıioöuü])\1\1')
+_FILLER_RE = re.compile(r'^(?:ı{2,}|e{2,}|a{2,}|hı+|h?ı*m{2,}|şey)$')
+
+COMMON_WORDS = frozenset(
+    "o bu şu ben sen biz siz onu ona ne bir her hep çok az en ve de da ki ya ile gibi daha ama".split()
+)
+
+
+class RepetitionDetector:
+    kind = 'tekrar'
+
+    def detect(self, word: str, history: Sequence[str]) -> Optional[str]:
+        if history and history[-1] == word:
+            return word
+        return None
+
+
+class SyllableRepetitionDetector:
+    kind = 'hece tekrarı'
+
+    def __init__(self, known_words: Iterable[str] = ()):
+        self.known_words = COMMON_WORDS.union(known_words)
+
+    def detect(self, word: str, history: Sequence[str]) -> Optional[str]:
+        fragments = _restart_fragments(word, history, self.known_words)
+        if len(fragments) >= 2 and len(set(fragments)) == 1:
+            return '-'.join(fragments + [word.split('-')[-1]])
+        return None
+
+
+class PartWordRestartDetector:
+    kind = 'kekeme'
+
+    def __init__(self, known_words: Iterable[str] = ()):
+        self.known_words = COMMON_WORDS.union(known_words)
+
+    def detect(self, word: str, history: Sequence[str]) -> Optional[str]:
+        fragments = _restart_fragments(word, history, self.known_words)
+        if fragments and (len(fragments) == 1 or len(set(fragments)) > 1):
+            return '-'.join(fragments + [word.split('-')[-1]])
+        return None
+
+
+class FillerDetector:
+    kind = 'dolgu'
+
+    def detect(self, word: str, history: Sequence[str]) -> Optional[str]:
+        if _FILLER_RE.match(word):
+            return word
+        return None
+
+
+class ProlongationDetector:
+    kind = 'uzatma'
+
+    def detect(self, word: str, history: Sequence[str]) -> Optional[str]:
+        if _PROLONGATION_RE.search(word) and not _FILLER_RE.match(word):
+            return word
+        return None
+
+
+def _restart_fragments(word: str, history: Sequence[str], known_words=COMMON_WORDS) -> List[str]:
+    if '-' in word:
+        parts = word.split('-')
+        target = parts[-1]
+        fragments = [p for p in parts[:-1] if p]
+        if fragments and all(target.startswith(p) and len(p) < len(target) for p in fragments):
+            return fragments
+        return []
+
+    fragments = []
+    for previous in reversed(history):
+        if (len(previous) < len(word) and len(previous) <= len(word) // 2 + 1 and word.startswith(previous)
+                and previous not in known_words):
+            fragments.append(previous)
+        else:
+            break
+    fragments.reverse()
+    return fragments
+
+
+def default_detectors(known_words: Iterable[str] = ()):
+    known_words = frozenset(known_words)
+    return [
+        RepetitionDetector(),
+        SyllableRepetitionDetector(known_words),
+        PartWordRestartDetector(known_words),
+        FillerDetector(),
+        ProlongationDetector()
+    ]
+
+
+def segment_words(segment: dict):
+    words = turkish_lower(_PUNCTUATION_RE.sub(' ', segment['text'])).split()
+    timed_words = segment.get('words')
+    if timed_words and len(timed_words) == len(words):
+        return [(w, float(t['start'])) for w, t in zip(words, timed_words)]
+
+    start, end = segment['start'], segment['end']
+    step = (end - start) / len(words) if words else 0.0
+    return [(w, start + i * step) for i, w in enumerate(words)]
+
+
+class DisfluencyTracker:
+    def __init__(self, detectors=None, history_size: int = 8, known_words: Iterable[str] = ()):
+        self.detectors = detectors if detectors is not None else default_detectors(known_words)
+        self.history = deque(maxlen=history_size)
+        self.events: List[dict] = []
+
+    def process_segment(self, segment: dict) -> List[dict]:
+        new_events = []
+        for word, timestamp in segment_words(segment):
+            for detector in self.detectors:
+                reported = detector.detect(word, self.history)
+                if reported is not None:
+                    new_events.append({
+                        'type': detector.kind,
+                        'word': reported,
+                        'timestamp': round(timestamp, 2)
+                    })
+            self.history.append(word)
+        self.events.extend(new_events)
+        return new_events
+
+    def reset(self):
+        self.history.clear()
+        self.events = []
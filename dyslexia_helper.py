@@ -1,11 +1,21 @@
-import time
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, font
 import threading
-import json
-import re
-
-from capture_client import CaptureTranscriptionClient
+import time
+from typing import Dict, Optional
+
+from connection_manager import ConnectionManager
+from fuzzy_match import confidence_tag
+from hallucination_filter import HallucinationFilter
+from latency_metrics import metrics
+from normalization import normalize_word
+from passage_library import PassageLibrary
+from reading_analysis import remove_punctuation_and_lowercase, tokenize_text
+from reading_core import build_report, load_config, prepare_reference, save_config, transcript_edit
+from reading_session import ReadingSession
+from reading_window import ReadingWindow
+from render_scheduler import RenderScheduler
+from session_history import SessionHistory, session_record
 
 
 class DyslexiaFrontendApp:
@@ -15,41 +25,41 @@ class DyslexiaFrontendApp:
         self.root.geometry("800x600")
 
         self.load_config()
+        self.hallucination_filter = HallucinationFilter.from_config(self.config)
         self.setup_styles()
 
         self.reference_words = []
+        self.reading_window = None
+        self.displayed_transcript = None
         self.next_word_index = 0
+        self.session = ReadingSession([])
 
-        self.sample_texts = {
-            "Kısa Metin (Kolay)": "Küçük kedi bahçede oyun oynuyor. Renkli bir kelebek gördü ve peşinden koştu.",
-            "Orta Metin": "Ali okula giderken yolda arkadaşı Ayşe'yi gördü. Birlikte yürümeye başladılar. Hava çok güzeldi ve kuşlar ötüyordu.",
-            "Uzun Metin (Zor)": "Geçen hafta sonu ailemle birlikte pikniğe gittik. Yeşil çimenlerin üzerine battaniyemizi serdik. Annem lezzetli sandviçler hazırlamıştı. Kardeşim top oynamak istedi ve hep beraber oynadık."
-        }
+        self.passage_library = PassageLibrary(self.config.get('passage_library', 'passages.db'))
+        self.passage_page_size = 8
+        self.page_starts = [None]
+        self.page_passages = []
+        self.has_next_page = False
+        self.current_passage = None
+        self.history = SessionHistory(self.config.get('history_db', 'history.db'))
+        self.session_started_at = 0.0
 
         self.create_notebook()
+        self.render_scheduler = RenderScheduler(self.root, self.render_updates)
 
-        self.transcription_client = None
+        self.connection = ConnectionManager(self.config)
+        self.root.after_idle(self.connection.start)
         self.is_streaming = False
 
-        self.all_segments = []
+        self.debug_overlay = None
+        if self.config.get('metrics'):
+            metrics.enable()
+        self.root.bind('<Control-D>', lambda event: self.toggle_debug_overlay())
 
     def load_config(self):
-        try:
-            with open('config.json', 'r') as f:
-                self.config = json.load(f)
-        except:
-            self.config = {
-                "host": "localhost",
-                "port": 9090,
-                "model": "large-v3-turbo",
-                "lang": "tr",
-                "use_vad": False
-            }
-            self.save_config()
+        self.config = load_config()
 
     def save_config(self):
-        with open('config.json', 'w') as f:
-            json.dump(self.config, f)
+        save_config(self.config)
 
     def create_notebook(self):
         self.notebook = ttk.Notebook(self.root)
@@ -57,6 +67,8 @@ class DyslexiaFrontendApp:
 
         self.create_main_frame()
         self.create_results_frame()
+        self.create_progress_frame()
+        self.notebook.bind('<<NotebookTabChanged>>', lambda event: self.on_tab_changed())
 
     def create_main_frame(self):
         main_frame = ttk.Frame(self.notebook)
@@ -65,18 +77,28 @@ class DyslexiaFrontendApp:
         text_frame = ttk.LabelFrame(main_frame, text='Metin Seçimi', padding=10)
         text_frame.pack(fill='x', padx=10, pady=5)
 
-        self.radio_buttons = []
-        self.text_var = tk.StringVar()
-        for text_name in self.sample_texts.keys():
-            rb = ttk.Radiobutton(
-                text_frame,
-                text=text_name,
-                variable=self.text_var,
-                value=text_name,
-                command=self.update_text
-            )
-            rb.pack(anchor='w')
-            self.radio_buttons.append(rb)
+        filter_row = ttk.Frame(text_frame)
+        filter_row.pack(fill='x')
+        ttk.Label(filter_row, text='Seviye:').pack(side='left')
+        self.level_var = tk.StringVar(value='Tümü')
+        self.level_box = ttk.Combobox(
+            filter_row, textvariable=self.level_var, state='readonly', width=8,
+            values=['Tümü'] + [str(level) for level in self.passage_library.levels()]
+        )
+        self.level_box.pack(side='left', padx=5)
+        self.level_box.bind('<<ComboboxSelected>>', lambda event: self.show_passage_page())
+
+        self.next_page_button = ttk.Button(filter_row, text='▶', width=3, command=lambda: self.show_passage_page(1))
+        self.next_page_button.pack(side='right')
+        self.page_label = ttk.Label(filter_row, text='')
+        self.page_label.pack(side='right', padx=5)
+        self.prev_page_button = ttk.Button(filter_row, text='◀', width=3, command=lambda: self.show_passage_page(-1))
+        self.prev_page_button.pack(side='right')
+
+        self.passage_list = tk.Listbox(text_frame, height=4, exportselection=False, font=('Comic Sans MS', 11))
+        self.passage_list.pack(fill='x', pady=5)
+        self.passage_list.bind('<<ListboxSelect>>', lambda event: self.update_text())
+        self.show_passage_page()
 
         self.custom_button = ttk.Button(
             text_frame,
@@ -131,152 +153,146 @@ class DyslexiaFrontendApp:
         self.results_text.tag_configure('blue', foreground='#4682B4')
         self.results_text.tag_configure('purple', foreground='#9370DB')
         self.results_text.tag_configure('blue_bold', font=underline_font, foreground='blue')
+        self.results_text.tag_configure('toggle', font=underline_font, foreground='#4682B4')
+        self.collapsed_sections = set()
+
+    def create_progress_frame(self):
+        self.progress_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.progress_frame, text='İlerlemem')
+
+        self.progress_text = scrolledtext.ScrolledText(
+            self.progress_frame,
+            wrap=tk.WORD,
+            font=('Comic Sans MS', 12),
+            height=20,
+            background='#F0FFF0'
+        )
+        self.progress_text.pack(fill='both', expand=True, padx=10, pady=5)
+        self.progress_text.tag_configure('purple', foreground='#9370DB')
+        self.progress_text.tag_configure('blue', foreground='#4682B4')
+        self.progress_text.tag_configure('red', foreground='#CD5C5C')
+
+    def on_tab_changed(self):
+        if self.notebook.select() == str(self.progress_frame):
+            self.show_progress()
+
+    def show_progress(self):
+        student = self.config.get('student', 'Öğrenci')
+        progress = self.history.progress(student)
+
+        self.progress_text.config(state='normal')
+        self.progress_text.delete(1.0, tk.END)
+        self.progress_text.insert(tk.END, f"📈 {student} - İLERLEMEM\n\n", 'purple')
+        if progress is None:
+            self.progress_text.insert(tk.END, "Henüz kayıtlı okuma yok.\n", 'blue')
+        else:
+            self.progress_text.insert(tk.END, f"📚 Okuma sayısı: {progress['sessions']}\n", 'blue')
+            self.progress_text.insert(tk.END, f"🎯 Ortalama doğruluk: %{progress['average_accuracy']:.1f} "
+                                              f"(en iyi %{progress['best_accuracy']:.1f}, "
+                                              f"son %{progress['last_accuracy']:.1f})\n", 'blue')
+            self.progress_text.insert(tk.END, f"⏱️ Ortalama hız: Dakikada {progress['average_words_per_minute']:.1f} "
+                                              f"kelime (son {progress['last_words_per_minute']:.1f})\n\n", 'blue')
+            if progress['problem_words']:
+                self.progress_text.insert(tk.END, "🔁 En çok zorlandığım kelimeler:\n", 'purple')
+                for word, count in progress['problem_words']:
+                    self.progress_text.insert(tk.END, f"• {word} ({count} kez)\n", 'red')
+        self.progress_text.config(state='disabled')
 
     def remove_punctuation_and_lowercase(self, text):
-        text_no_punc = re.sub(r'[^\w\s]', '', text)
-        return text_no_punc.lower()
+        return remove_punctuation_and_lowercase(text)
 
     def detect_stuttering(self):
-        stuttering = []
-
-        for segment in self.all_segments:
-            clean_text = re.sub(r'[^\w\s]', ' ', segment['text'])
-            words = clean_text.lower().split()
-
-            for i, word in enumerate(words):
-                if not word:
-                    continue
-
-                if i > 0 and word == words[i - 1]:
-                    stuttering.append({
-                        'type': 'tekrar',
-                        'word': word,
-                        'timestamp': round(float(segment['start']), 2)
-                    })
-
-                if '-' in word:
-                    parts = word.split('-')
-                    if len(parts) >= 2 and any(p and parts[-1].startswith(p) for p in parts[:-1]):
-                        stuttering.append({
-                            'type': 'kekeme',
-                            'word': word,
-                            'timestamp': round(float(segment['start']), 2)
-                        })
-
-                vowels = 'aeıioöuü'
-                for v in vowels:
-                    if v * 3 in word:
-                        stuttering.append({
-                            'type': 'uzatma',
-                            'word': word,
-                            'timestamp': round(float(segment['start']), 2)
-                        })
-                        break
-
-        return stuttering
+        return self.session.disfluency_tracker.events
 
     def analyze_reading(self):
-        analysis = {
-            'hesitations': [],
-            'pauses': [],
-            'mispronunciations': [],
-            'reading_speed': 0.0,
-            'accuracy': 0.0
-        }
-
-        spoken_text_raw = " ".join([s['text'] for s in self.all_segments])
-        spoken_cleaned = self.remove_punctuation_and_lowercase(spoken_text_raw)
-        spoken_words = spoken_cleaned.split()
-
-        ref_words = [self.remove_punctuation_and_lowercase(w) for w in self.reference_words]
-
-        if not spoken_words:
-            return analysis
-
-        total_time = float(self.all_segments[-1]['end']) - float(self.all_segments[0]['start'])
-        if total_time > 0:
-            analysis['reading_speed'] = len(spoken_words) / (total_time / 60)
-        else:
-            analysis['reading_speed'] = 0
-
-        for i in range(len(self.all_segments) - 1):
-            pause_duration = float(self.all_segments[i + 1]['start']) - float(self.all_segments[i]['end'])
-            if pause_duration > 1.0:
-                analysis['pauses'].append({
-                    'duration': round(pause_duration, 2),
-                    'position': self.all_segments[i]['text']
-                })
-
-        analysis['hesitations'] = self.detect_stuttering()
-
-        for spoken_word in spoken_words:
-            if spoken_word not in ref_words:
-                analysis['mispronunciations'].append(spoken_word)
-
-        if ref_words:
-            matched_words = set()
-            correct_words = 0
-            for w in spoken_words:
-                if w in ref_words and w not in matched_words:
-                    correct_words += 1
-                    matched_words.add(w)
-            analysis['accuracy'] = (correct_words / len(ref_words)) * 100
-
-        return analysis
-
-    def format_analysis_results(self, analysis):
-        self.results_text.delete(1.0, tk.END)
+        return self.session.analyze()
 
-        self.results_text.insert(tk.END, "🌈 OKUMA RAPORUM 🌈\n\n", 'purple')
-        self.results_text.insert(tk.END, "🎯 Nasıl Okudum?\n", 'underline_font')
-
-        accuracy = analysis['accuracy']
-        speed = analysis['reading_speed']
+    def format_analysis_results(self, report):
+        self.results_text.delete(1.0, tk.END)
+        self.collapsed_sections = set(report['sections'].values())
+        for toggle, body in report['sections'].items():
+            self.results_text.tag_configure(body, elide=True)
+            self.results_text.tag_bind(toggle, '<Button-1>', lambda event, body=body: self.toggle_report_section(body))
+        if report['chunks']:
+            self.results_text.insert(tk.END, *report['chunks'])
+        self.notebook.select(1)
 
-        if accuracy >= 90:
-            self.results_text.insert(tk.END, f"🟢 Doğruluk: %{accuracy:.1f} - Harika okudun! Çok başarılısın! 🏆\n",
-                                     'green')
-        elif accuracy >= 70:
-            self.results_text.insert(tk.END,
-                                     f"🟡 Doğruluk: %{accuracy:.1f} - İyi iş çıkardın! Biraz daha pratik yapalım! 👍\n",
-                                     'yellow')
+    def toggle_report_section(self, body: str):
+        collapsed = body not in self.collapsed_sections
+        if collapsed:
+            self.collapsed_sections.add(body)
         else:
-            self.results_text.insert(tk.END, f"🔴 Doğruluk: %{accuracy:.1f} - Birlikte daha çok çalışalım! 💪\n", 'red')
-
-        self.results_text.insert(tk.END, f"📚 Hızım: Dakikada {speed:.1f} kelime\n\n", 'blue')
-
-        if analysis['hesitations'] or analysis['mispronunciations']:
-            self.results_text.insert(tk.END, "🎯 Geliştirebileceğim Noktalar:\n", 'underline_font')
-
-            if analysis['hesitations']:
-                self.results_text.insert(tk.END, "🗣️ Tekrarladığım Kelimeler:\n", 'purple')
-                for h in analysis['hesitations']:
-                    self.results_text.insert(tk.END, f"• {h['word']} ({h['type']})\n", 'yellow')
-
-            if analysis['mispronunciations']:
-                self.results_text.insert(tk.END, "📝 Yanlış Okuduğum Kelimeler:\n", 'purple')
-                for word in analysis['mispronunciations']:
-                    self.results_text.insert(tk.END, f"• {word}\n", 'red')
-
-        self.notebook.select(1)
+            self.collapsed_sections.discard(body)
+        self.results_text.tag_configure(body, elide=collapsed)
 
     def finalize_reading(self, use_stored_segments=False):
+        self.render_scheduler.flush()
+
         if self.is_streaming:
             self.stop_streaming()
 
-        if self.all_segments:
-            if use_stored_segments:
-                analysis = self.analyze_reading()
-            else:
-                analysis = self.analyze_reading()
-
-            self.format_analysis_results(analysis)
-            self.all_segments.clear()
+        session = self.session
+        if not session.finish():
+            return
+        self.session = ReadingSession([])
+
+        record = (self.config.get('student', 'Öğrenci'), self.session_started_at,
+                  time.time() - self.session_started_at, self.current_passage)
+
+        def build_results():
+            analysis = session.analyze()
+            report = build_report(analysis)
+            self.root.after(0, lambda: self.format_analysis_results(report))
+            student, started_at, duration, passage = record
+            self.history.submit(session_record(student, analysis, started_at, duration, passage))
+
+        threading.Thread(target=build_results, daemon=True).start()
+
+    def show_passage_page(self, step: int = 0):
+        if step == 0:
+            self.page_starts = [None]
+        elif step > 0 and self.has_next_page:
+            last = self.page_passages[-1]
+            self.page_starts.append((last['level'], last['word_count'], last['id']))
+        elif step < 0 and len(self.page_starts) > 1:
+            self.page_starts.pop()
+
+        level = self.level_var.get()
+        passages = self.passage_library.page(
+            self.passage_page_size + 1, self.page_starts[-1],
+            level=None if level == 'Tümü' else int(level)
+        )
+        self.has_next_page = len(passages) > self.passage_page_size
+        self.page_passages = passages[:self.passage_page_size]
+
+        self.passage_list.delete(0, tk.END)
+        for passage in self.page_passages:
+            self.passage_list.insert(tk.END, f"{passage['title']} ({passage['word_count']} kelime)")
+        self.page_label.config(text=f"Sayfa {len(self.page_starts)}")
+        self.update_page_buttons()
+
+    def update_page_buttons(self):
+        self.prev_page_button.config(state='normal' if len(self.page_starts) > 1 else 'disabled')
+        self.next_page_button.config(state='normal' if self.has_next_page else 'disabled')
+
+    def set_selection_enabled(self, enabled: bool):
+        self.level_box.config(state='readonly' if enabled else 'disabled')
+        self.passage_list.config(state='normal' if enabled else 'disabled')
+        self.custom_button.config(state='normal' if enabled else 'disabled')
+        if enabled:
+            self.update_page_buttons()
+        else:
+            self.prev_page_button.config(state='disabled')
+            self.next_page_button.config(state='disabled')
 
     def toggle_custom_text(self):
-        self.text_var.set('')
+        self.passage_list.selection_clear(0, tk.END)
+        self.current_passage = None
+        self.reading_window = None
+        self.reading_frame.config(text='Okuma Metni')
         self.text_area.config(state='normal')
         self.text_area.delete(1.0, tk.END)
+        self.forget_transcript_region()
         self.text_area.focus()
 
     def update_text(self):
@@ -284,17 +300,25 @@ class DyslexiaFrontendApp:
             messagebox.showinfo("Uyarı", "Okuma devam ederken yeni bir metin seçemezsiniz!")
             return
 
-        selected = self.text_var.get()
-        if selected in self.sample_texts:
-            self.text_area.config(state='normal')
-            self.text_area.delete(1.0, tk.END)
-            self.text_area.insert(tk.END, self.sample_texts[selected])
-            self.text_area.config(state='disabled')
+        selection = self.passage_list.curselection()
+        if not selection:
+            return
+        passage = self.passage_library.load(self.page_passages[selection[0]]['id'])
+        if passage is not None:
+            self.current_passage = passage
+            self.reading_window = ReadingWindow(passage['body'], self.config.get('page_words', 150))
+            self.forget_transcript_region()
+            self.render_reading_window()
 
     def show_settings(self):
         settings_window = tk.Toplevel(self.root)
         settings_window.title('Ayarlar')
-        settings_window.geometry('400x400')
+        settings_window.geometry('400x460')
+
+        ttk.Label(settings_window, text='Öğrenci:').pack(pady=5)
+        student_entry = ttk.Entry(settings_window, width=30)
+        student_entry.insert(0, self.config.get('student', 'Öğrenci'))
+        student_entry.pack(pady=5)
 
         ttk.Label(settings_window, text='Host:').pack(pady=5)
         host_entry = ttk.Entry(settings_window, width=30)
@@ -317,11 +341,13 @@ class DyslexiaFrontendApp:
         lang_entry.pack(pady=5)
 
         def save_settings():
+            self.config['student'] = student_entry.get().strip() or 'Öğrenci'
             self.config['host'] = host_entry.get()
             self.config['port'] = int(port_entry.get())
             self.config['model'] = model_entry.get()
             self.config['lang'] = lang_entry.get()
             self.save_config()
+            self.connection.restart()
             settings_window.destroy()
 
         ttk.Button(settings_window, text='Kaydet', command=save_settings).pack(pady=10)
@@ -341,58 +367,55 @@ class DyslexiaFrontendApp:
         self.results_text.delete(1.0, tk.END)
 
         self.text_area.config(state='normal')
-        raw_text = self.text_area.get("1.0", tk.END)
-        lines = []
-        for line in raw_text.splitlines():
-            if not line.strip().startswith("OKUNULAN:"):
-                lines.append(line)
-        cleaned_text = "\n".join(lines)
-        self.reference_words = self.tokenize_text(cleaned_text.strip())
-        self.next_word_index = 0
+        self.remove_transcript_region()
+
+        passage = self.current_passage
+        window = self.reading_window
+        if window is not None and (passage is not None or not window.complete):
+            reference_text = window.text
+            window.reset()
+        else:
+            reference_text = self.text_area.get("1.0", "end-1c").rstrip()
+            self.reading_window = ReadingWindow(reference_text, self.config.get('page_words', 150))
 
-        for tag_name in self.text_area.tag_names():
-            self.text_area.tag_remove(tag_name, "1.0", tk.END)
-
-        content = self.text_area.get("1.0", tk.END)
-        idx = content.find("OKUNULAN:")
-        if idx != -1:
-            row = content[:idx].count('\n') + 1
-            next_newline = content.find('\n', idx)
-            if next_newline == -1:
-                next_newline = len(content)
-            self.text_area.delete(f"{row}.0", f"{row + 1}.0")
-
-        while True:
-            last_char = self.text_area.get("end-2c", "end-1c")
-            if last_char in ["\n", " "]:
-                self.text_area.delete("end-2c", "end-1c")
-            else:
-                break
+        self.reference_words, normalized_words = prepare_reference(reference_text, passage)
+        self.next_word_index = 0
+        self.render_reading_window()
+        self.text_area.config(state='normal')
+        self.session_started_at = time.time()
+        self.session = ReadingSession(
+            self.reference_words,
+            normalized_words=normalized_words,
+            hallucination_filter=self.hallucination_filter,
+            on_highlight=self.render_scheduler.highlight,
+            on_transcript=self.render_scheduler.transcript,
+            on_finished=lambda: self.root.after(0, lambda: self.finalize_reading(use_stored_segments=True))
+        )
+        self.render_scheduler.reset_stats()
 
+        self.text_area.mark_set('okunulan_line', 'end-1c')
+        self.text_area.mark_gravity('okunulan_line', 'left')
         self.text_area.insert(tk.END, "\n\nOKUNULAN: ")
-        self.okunulan_start_index = self.text_area.index(tk.END)
-        self.text_area.insert(tk.END, "...\n")
+        self.text_area.mark_set('okunulan_text', 'end-1c')
+        self.text_area.mark_gravity('okunulan_text', 'left')
+        self.text_area.insert(tk.END, "...")
+        self.displayed_transcript = "..."
 
         self.text_area.config(state='disabled')
 
-        for rb in self.radio_buttons:
-            rb.config(state='disabled')
-        self.custom_button.config(state='disabled')
-
-        def run_client():
-            self.transcription_client = CaptureTranscriptionClient(
-                host=self.config['host'],
-                port=self.config['port'],
-                lang=self.config['lang'],
-                model=self.config['model'],
-                use_vad=self.config['use_vad'],
-                translate=False,
-                text_callback=self.handle_live_transcript
-            )
-            self.transcription_client()
-
-        self.stream_thread = threading.Thread(target=run_client, daemon=True)
-        self.stream_thread.start()
+        self.set_selection_enabled(False)
+
+        self.connection.start()
+        if self.connection.error is not None:
+            self.connection.restart()
+        self.connection.attach(self.handle_live_transcript, session={
+            'student': self.config.get('student', 'Öğrenci'),
+            'passage_id': passage['id'] if passage else None,
+            'title': passage['title'] if passage else None,
+            'text': reference_text
+        })
+        if self.connection.ready.is_set():
+            return
 
         prep_window = tk.Toplevel(self.root)
         prep_window.title('Hazırlanıyor')
@@ -409,18 +432,19 @@ class DyslexiaFrontendApp:
         message_label.pack(expand=True)
 
         def wait_for_server_ready():
-            while True:
-                if (self.transcription_client
-                        and self.transcription_client.client
-                        and self.transcription_client.client.recording):
-                    break
-                time.sleep(0.2)
+            ready = self.connection.wait_ready(self.config.get('ready_timeout', 30))
+            error = self.connection.error
 
             def on_ready():
                 message_label.config(text='Sunucu hazır, başlayabilirsiniz!')
                 self.root.after(1000, prep_window.destroy)
 
-            self.root.after(0, on_ready)
+            def on_timeout():
+                message_label.config(text=f"{error or 'Sunucuya bağlanılamadı.'}\nLütfen ayarları kontrol edin.")
+                self.root.after(2000, prep_window.destroy)
+                self.stop_streaming()
+
+            self.root.after(0, on_ready if ready else on_timeout)
 
         threading.Thread(target=wait_for_server_ready, daemon=True).start()
 
@@ -431,111 +455,140 @@ class DyslexiaFrontendApp:
         self.is_streaming = False
         self.record_button.config(text='🎤 Okumaya Başla')
 
-        if self.transcription_client and self.transcription_client.client:
-            try:
-                self.transcription_client.client.close_websocket()
-            except:
-                pass
-        self.transcription_client = None
+        self.connection.detach()
+        if metrics.enabled and self.config.get('metrics_file'):
+            metrics.dump(self.config['metrics_file'])
 
-        for rb in self.radio_buttons:
-            rb.config(state='normal')
-        self.custom_button.config(state='normal')
+        self.set_selection_enabled(True)
 
         self.text_area.config(state='normal')
 
         self.finalize_reading(use_stored_segments=True)
 
-    def handle_live_transcript(self, segments):
-        new_text = segments[-1]["text"].strip()
-
-        phrases_to_check = ["Altyazı M.K.", "İzlediğiniz için teşekkür ederim.", "abone ol"]
-
-        if any(phrase.lower() in new_text.lower() for phrase in phrases_to_check):
-            return
-
-        self.all_segments = segments.copy()
-
-        spoken_words = self.tokenize_text(new_text)
-
-        self.root.after(0, lambda: self.update_currently_said_text(new_text))
-
-        for w in spoken_words:
-            if self.next_word_index >= len(self.reference_words):
-                break
-
-            ref_word = self.reference_words[self.next_word_index]
-            if self.normalize_word(w) == self.normalize_word(ref_word):
-                self.root.after(0, self.highlight_word, self.next_word_index, True)
-                self.next_word_index += 1
-            else:
-                self.root.after(0, self.highlight_word, self.next_word_index, False)
+    def handle_live_transcript(self, finalized, pending):
+        self.session.handle_transcript(finalized, pending)
+        self.next_word_index = self.session.next_word_index
 
-        if self.next_word_index >= len(self.reference_words):
-            self.root.after(0, lambda: self.finalize_reading(use_stored_segments=True))
-
-    def update_currently_said_text(self, partial_text: str):
+    def render_updates(self, highlights: Dict[int, Optional[float]], transcript: Optional[str]):
         self.text_area.config(state='normal')
 
-        text_content = self.text_area.get("1.0", tk.END)
-        okunulan_pos = text_content.find("OKUNULAN:")
-
-        if okunulan_pos != -1:
-            row = text_content[:okunulan_pos].count('\n') + 1
-            col = okunulan_pos - text_content[:okunulan_pos].rfind('\n') - 1
-            start_idx = f"{row}.{col + 10}"
-
-            self.text_area.delete(start_idx, tk.END)
-            self.text_area.insert(tk.END, f" {partial_text}\n")
+        if highlights:
+            self.highlight_words(highlights)
+        if transcript is not None:
+            self.update_currently_said_text(transcript)
 
         self.text_area.config(state='disabled')
-        self.text_area.see(tk.END)
+        if transcript is not None:
+            self.text_area.see(tk.END)
 
-    def highlight_word(self, word_index: int, correct: bool):
-        self.text_area.config(state='normal')
+    def update_currently_said_text(self, partial_text: str):
+        shown = self.displayed_transcript
+        if shown is None:
+            return
 
-        start_idx, end_idx = self.find_word_position_in_text_area(word_index)
-        if start_idx is not None and end_idx is not None:
-            tag = 'high_conf' if correct else 'low_conf'
-            self.text_area.tag_remove('high_conf', start_idx, end_idx)
-            self.text_area.tag_remove('low_conf', start_idx, end_idx)
-            self.text_area.tag_add(tag, start_idx, end_idx)
+        common, added = transcript_edit(shown, partial_text)
+        if common < len(shown):
+            self.text_area.delete(f"okunulan_text + {common} chars", "end-1c")
+        if added:
+            self.text_area.insert("end-1c", added)
+        self.displayed_transcript = partial_text
+
+    def remove_transcript_region(self):
+        if self.displayed_transcript is not None:
+            self.text_area.delete('okunulan_line', 'end-1c')
+        self.forget_transcript_region()
+
+    def forget_transcript_region(self):
+        if self.displayed_transcript is not None:
+            self.text_area.mark_unset('okunulan_line', 'okunulan_text')
+            self.displayed_transcript = None
+
+    def render_reading_window(self):
+        window = self.reading_window
+        shown = window.render(self.next_word_index)
+        state = self.text_area.cget('state')
+        self.text_area.config(state='normal')
+        if self.displayed_transcript is not None:
+            self.text_area.mark_gravity('okunulan_line', 'right')
+            self.text_area.delete('1.0', 'okunulan_line')
+            self.text_area.insert('1.0', shown)
+            self.text_area.mark_gravity('okunulan_line', 'left')
+        else:
+            self.text_area.delete('1.0', tk.END)
+            self.text_area.insert('1.0', shown)
+        for tag, ranges in window.tag_ranges().items():
+            if ranges:
+                self.text_area.tag_add(tag, *ranges)
+        self.text_area.config(state=state)
+        self.reading_frame.config(text=f'Okuma Metni ({window.page + 1}/{window.page_count})')
+
+    def highlight_words(self, highlights: Dict[int, Optional[float]]):
+        window = self.reading_window
+        if window is None:
+            return
+        highlights = window.update(highlights)
+        if window.needs_render(self.next_word_index):
+            self.render_reading_window()
+            return
 
-        self.text_area.config(state='disabled')
+        cleared = []
+        ranges = {'high_conf': [], 'med_conf': [], 'low_conf': []}
+        for word_index, score in highlights.items():
+            start_idx, end_idx = self.find_word_position_in_text_area(word_index)
+            if start_idx is None or end_idx is None:
+                continue
+            cleared.extend((start_idx, end_idx))
+            tag = confidence_tag(score)
+            if tag is not None:
+                ranges[tag].extend((start_idx, end_idx))
+
+        if cleared:
+            for tag in ranges:
+                self.text_area.tk.call(str(self.text_area), 'tag', 'remove', tag, *cleared)
+        for tag, tag_ranges in ranges.items():
+            if tag_ranges:
+                self.text_area.tag_add(tag, *tag_ranges)
 
     def find_word_position_in_text_area(self, word_index: int):
-        target_word = self.reference_words[word_index]
-        text_content = self.text_area.get("1.0", tk.END)
-        tokens = text_content.split()
-
-        if word_index < len(tokens):
-            word_to_find = tokens[word_index]
-
-            pos = text_content.find(word_to_find)
-            if pos == -1:
-                return None, None
-
-            row = text_content[:pos].count('\n') + 1
-            last_newline_idx = text_content[:pos].rfind('\n')
-            if last_newline_idx == -1:
-                col = pos
-            else:
-                col = pos - (last_newline_idx + 1)
-
-            start_index = f"{row}.{col}"
-            end_index = f"{row}.{col + len(word_to_find)}"
-            return start_index, end_index
-        else:
-            return None, None
+        position = self.reading_window.position(word_index) if self.reading_window is not None else None
+        return position if position is not None else (None, None)
 
     @staticmethod
     def tokenize_text(text: str):
-        tokens = text.strip().split()
-        return tokens
+        return tokenize_text(text)
 
     @staticmethod
     def normalize_word(word: str):
-        return re.sub(r"[^\wıüğşöçİÜĞŞÖÇ]", "", word, flags=re.UNICODE).lower()
+        return normalize_word(word)
+
+    def toggle_debug_overlay(self):
+        if self.debug_overlay is not None:
+            self.debug_overlay.destroy()
+            self.debug_overlay = None
+            if not self.config.get('metrics'):
+                metrics.disable()
+            return
+
+        metrics.enable()
+        self.debug_overlay = tk.Toplevel(self.root)
+        self.debug_overlay.title('Gecikme (ms)')
+        self.debug_overlay.protocol("WM_DELETE_WINDOW", self.toggle_debug_overlay)
+        label = tk.Label(self.debug_overlay, font=('Courier', 10), justify='left', anchor='w')
+        label.pack(fill='both', expand=True, padx=5, pady=5)
+
+        def refresh():
+            if self.debug_overlay is None:
+                return
+            summary = metrics.format_summary()
+            archive = self.connection.archive
+            if archive is not None:
+                stats = archive.stats()
+                summary += (f"\narchive fill {stats['fill_ratio'] * 100:.0f}% "
+                            f"(max {stats['high_water_ratio'] * 100:.0f}%), dropped {stats['dropped_seconds']:.1f} s")
+            label.config(text=summary)
+            self.root.after(500, refresh)
+
+        refresh()
 
     def setup_styles(self):
         style = ttk.Style()
@@ -552,6 +605,9 @@ class DyslexiaFrontendApp:
     def on_closing(self):
         if self.is_streaming:
             self.stop_streaming()
+        self.connection.stop()
+        self.passage_library.close()
+        self.history.close()
         self.root.destroy()
 
 
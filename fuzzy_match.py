@@ -0,0 +1,92 @@
+from functools import lru_cache
+from typing import Dict, Optional, Sequence
+
+from normalization import normalize_word
+
+PHONETIC_FOLD = str.maketrans('ğışçöü', 'giscou')
+
+HIGH_CONFIDENCE = 0.99
+MEDIUM_CONFIDENCE = 0.7
+
+
+@lru_cache(maxsize=65536)
+def phonetic_fold(word: str) -> str:
+    return word.translate(PHONETIC_FOLD)
+
+
+@lru_cache(maxsize=16384)
+def pattern_masks(pattern: str) -> Dict[str, int]:
+    masks: Dict[str, int] = {}
+    for i, c in enumerate(pattern):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    return masks
+
+
+def edit_distance(pattern: str, text: str) -> int:
+    start = 0
+    limit = min(len(pattern), len(text))
+    while start < limit and pattern[start] == text[start]:
+        start += 1
+    stop = 0
+    limit -= start
+    while stop < limit and pattern[-1 - stop] == text[-1 - stop]:
+        stop += 1
+    if start or stop:
+        pattern = pattern[start:len(pattern) - stop]
+        text = text[start:len(text) - stop]
+
+    m = len(pattern)
+    if not m or not text:
+        return m or len(text)
+
+    masks = pattern_masks(pattern)
+    get = masks.get
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    for c in text:
+        eq = get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ((xh | pv) ^ full)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | ((xv | ph) ^ full)
+        mv = ph & xv
+    return score
+
+
+def similarity(reference: str, spoken: str) -> float:
+    if reference == spoken:
+        return 1.0
+    folded_reference, folded_spoken = phonetic_fold(reference), phonetic_fold(spoken)
+    longest = max(len(reference), len(spoken))
+    if not longest:
+        return 1.0
+    if folded_reference == folded_spoken:
+        return 0.9
+    distance = edit_distance(folded_reference, folded_spoken)
+    return max(0.0, 1.0 - distance / longest) * 0.9
+
+
+def confidence_tag(score: Optional[float]) -> Optional[str]:
+    if score is None:
+        return None
+    if score >= HIGH_CONFIDENCE:
+        return 'high_conf'
+    if score >= MEDIUM_CONFIDENCE:
+        return 'med_conf'
+    return 'low_conf'
+
+
+class ReferenceScorer:
+    def __init__(self, normalized_reference: Sequence[str]):
+        self.reference = list(normalized_reference)
+
+    def __call__(self, spoken_word: str, ref_index: int) -> float:
+        return similarity(self.reference[ref_index], normalize_word(spoken_word))
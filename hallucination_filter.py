@@ -0,0 +1,185 @@
+from collections import deque
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from normalization import normalize_word
+
+DEFAULT_PHRASES = ["Altyazı M.K.", "İzlediğiniz için teşekkür ederim.", "Abone olmayı unutmayın.", "abone ol"]
+INFLECTION_SUFFIXES = ('In', 'Iz', 'InIz')
+_HARMONY = {'a': 'ı', 'ı': 'ı', 'e': 'i', 'i': 'i', 'o': 'u', 'u': 'u', 'ö': 'ü', 'ü': 'ü'}
+
+
+def inflections(stem: str) -> List[str]:
+    vowel = next((_HARMONY[c] for c in reversed(stem) if c in _HARMONY), 'i')
+    buffer = 'y' if stem[-1] in _HARMONY else ''
+    return [stem] + [stem + buffer + suffix.replace('I', vowel) for suffix in INFLECTION_SUFFIXES]
+
+
+def inflected_phrases(phrases: Sequence[Sequence[str]]) -> List[List[str]]:
+    expanded = []
+    for phrase in phrases:
+        if len(phrase) < 2:
+            expanded.append(list(phrase))
+            continue
+        expanded.extend(list(phrase[:-1]) + [last] for last in inflections(phrase[-1]))
+    return expanded
+
+
+class PhraseAutomaton:
+    def __init__(self, phrases: Sequence[Sequence[str]]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.match_length: List[int] = [0]
+
+        for phrase in phrases:
+            if not phrase:
+                continue
+            state = 0
+            for token in phrase:
+                next_state = self.goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.match_length.append(0)
+                    self.goto[state][token] = next_state
+                state = next_state
+            self.match_length[state] = max(self.match_length[state], len(phrase))
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and self.next(fallback, token) is None:
+                    fallback = self.fail[fallback]
+                target = self.next(fallback, token) or 0
+                self.fail[next_state] = target if target != next_state else 0
+                self.match_length[next_state] = max(self.match_length[next_state],
+                                                    self.match_length[self.fail[next_state]])
+
+    def next(self, state: int, token: str) -> Optional[int]:
+        return self.goto[state].get(token)
+
+    def step(self, state: int, token: str) -> int:
+        while state and self.next(state, token) is None:
+            state = self.fail[state]
+        return self.next(state, token) or 0
+
+    def find(self, tokens: Sequence[str]) -> List[tuple]:
+        spans = []
+        state = 0
+        for i, token in enumerate(tokens):
+            state = self.step(state, token)
+            length = self.match_length[state]
+            if length:
+                spans.append((i + 1 - length, i + 1))
+        return spans
+
+
+class HallucinationFilter:
+    def __init__(self, phrases: Sequence[str] = DEFAULT_PHRASES, max_ngram: int = 4,
+                 max_repeats: int = 3, keep_repeats: int = 2):
+        normalized = [[t for t in (normalize_word(w) for w in phrase.split()) if t] for phrase in phrases]
+        self.automaton = PhraseAutomaton(inflected_phrases(normalized))
+        self.max_ngram = max_ngram
+        self.max_repeats = max_repeats
+        self.keep_repeats = keep_repeats
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'HallucinationFilter':
+        return cls(
+            config.get('hallucination_phrases', DEFAULT_PHRASES),
+            max_repeats=config.get('hallucination_max_repeats', 3)
+        )
+
+    def step(self, tokens: Sequence[str], i: int, state: int, runs: Tuple[int, ...]):
+        token = tokens[i]
+        state = self.automaton.step(state, token)
+        marked = i + 1 - self.automaton.match_length[state] if self.automaton.match_length[state] else None
+
+        next_runs = []
+        for n in range(1, self.max_ngram + 1):
+            run = runs[n - 1] + 1 if i >= n and token and token == tokens[i - n] else 0
+            loop_length = n * (self.max_repeats - 1)
+            if run == loop_length:
+                start = i - run - n + 1 + n * self.keep_repeats
+            elif run > loop_length:
+                start = i
+            else:
+                start = None
+            if start is not None and (marked is None or start < marked):
+                marked = start
+            next_runs.append(run)
+        return state, tuple(next_runs), marked
+
+    def offending_tokens(self, tokens: Sequence[str]) -> List[bool]:
+        marks = []
+        state, runs = 0, (0,) * self.max_ngram
+        for i in range(len(tokens)):
+            state, runs, marked = self.step(tokens, i, state, runs)
+            marks.append(marked)
+        return stripped_tokens(marks)
+
+    def clean(self, text: str) -> str:
+        words = text.split()
+        stripped = self.offending_tokens([normalize_word(w) for w in words])
+        if not any(stripped):
+            return text
+        return " ".join(w for w, drop in zip(words, stripped) if not drop)
+
+
+def stripped_tokens(marks: Sequence[Optional[int]]) -> List[bool]:
+    stripped = [False] * len(marks)
+    reach = len(marks)
+    for i in range(len(marks) - 1, -1, -1):
+        if marks[i] is not None and marks[i] < reach:
+            reach = marks[i]
+        stripped[i] = i >= reach
+    return stripped
+
+
+class IncrementalFilter:
+    def __init__(self, hallucination_filter: HallucinationFilter):
+        self.filter = hallucination_filter
+        self._segment_id: Optional[Hashable] = None
+        self._text = ''
+        self._words: List[str] = []
+        self._tokens: List[str] = []
+        self._states: List[Tuple[int, Tuple[int, ...]]] = []
+        self._marks: List[Optional[int]] = []
+        self._marked = 0
+
+    def clean(self, segment_id: Hashable, text: str) -> str:
+        words = text.split()
+        if segment_id != self._segment_id:
+            self._segment_id = segment_id
+            common = 0
+        elif self._text and text.startswith(self._text):
+            boundary = text[len(self._text):len(self._text) + 1]
+            common = len(self._words) if not boundary or boundary.isspace() else max(len(self._words) - 1, 0)
+        else:
+            common = 0
+            limit = min(len(self._words), len(words))
+            while common < limit and self._words[common] == words[common]:
+                common += 1
+        self._text = text
+
+        self._marked -= sum(mark is not None for mark in self._marks[common:])
+        del self._words[common:]
+        del self._tokens[common:]
+        del self._states[common:]
+        del self._marks[common:]
+
+        state, runs = self._states[-1] if self._states else (0, (0,) * self.filter.max_ngram)
+        for word in words[common:]:
+            self._words.append(word)
+            self._tokens.append(normalize_word(word))
+            state, runs, marked = self.filter.step(self._tokens, len(self._tokens) - 1, state, runs)
+            self._states.append((state, runs))
+            self._marks.append(marked)
+            self._marked += marked is not None
+
+        if not self._marked:
+            return text
+        return " ".join(w for w, drop in zip(self._words, stripped_tokens(self._marks)) if not drop)
@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+from typing import Dict
+
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_SUB_BUCKETS = SUB_BUCKETS >> 1
+MAX_SHIFT = 40
+
+STAGES = (
+    'connect_cold',
+    'connect_reconnect',
+    'session_start',
+    'server_lag',
+    'process_segments',
+    'handle_live_transcript',
+    'session_queue',
+    'session_drain',
+    'archive_write',
+    'tk_after_queue',
+    'highlight_render',
+    'message_to_highlight'
+)
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (SUB_BUCKETS + MAX_SHIFT * HALF_SUB_BUCKETS)
+        self.total = 0
+        self.max_value = 0
+
+    @staticmethod
+    def bucket_index(micros: int) -> int:
+        if micros < SUB_BUCKETS:
+            return max(micros, 0)
+        shift = micros.bit_length() - SUB_BUCKET_BITS
+        return SUB_BUCKETS + (shift - 1) * HALF_SUB_BUCKETS + (micros >> shift) - HALF_SUB_BUCKETS
+
+    @staticmethod
+    def bucket_value(index: int) -> int:
+        if index < SUB_BUCKETS:
+            return index
+        shift = (index - SUB_BUCKETS) // HALF_SUB_BUCKETS + 1
+        mantissa = (index - SUB_BUCKETS) % HALF_SUB_BUCKETS + HALF_SUB_BUCKETS
+        return mantissa << shift
+
+    def record(self, seconds: float):
+        micros = int(seconds * 1_000_000)
+        index = min(self.bucket_index(micros), len(self.counts) - 1)
+        self.counts[index] += 1
+        self.total += 1
+        if micros > self.max_value:
+            self.max_value = micros
+
+    def percentile(self, fraction: float) -> float:
+        if not self.total:
+            return 0.0
+        target = max(int(fraction * self.total + 0.5), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.bucket_value(index), self.max_value) / 1000
+        return self.max_value / 1000
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self.total,
+            'p50_ms': round(self.percentile(0.50), 3),
+            'p95_ms': round(self.percentile(0.95), 3),
+            'p99_ms': round(self.percentile(0.99), 3),
+            'max_ms': round(self.max_value / 1000, 3)
+        }
+
+
+class LatencyMetrics:
+    def __init__(self):
+        self.enabled = False
+        self.current_arrival = 0.0
+        self._lock = threading.Lock()
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self.histograms = {stage: LatencyHistogram() for stage in STAGES}
+
+    @staticmethod
+    def now() -> float:
+        return time.perf_counter()
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {stage: histogram.summary() for stage, histogram in self.histograms.items()}
+
+    def format_summary(self) -> str:
+        lines = [f"{'stage':<24}{'n':>7}{'p50':>9}{'p95':>9}{'p99':>9}"]
+        for stage, stats in self.summary().items():
+            lines.append(f"{stage:<24}{stats['count']:>7}{stats['p50_ms']:>9.2f}"
+                         f"{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}")
+        return "\n".join(lines)
+
+    def dump(self, path: str):
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'time': time.time(), 'stages': self.summary()}) + "\n")
+
+
+metrics = LatencyMetrics()
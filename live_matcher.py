@@ -0,0 +1,154 @@
+from bisect import bisect_right
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+class IncrementalMatcher:
+    def __init__(self, reference_ids: Sequence[int], encode: Callable[[str], int], lookahead: int = 4,
+                 ignored_id: Optional[int] = None, scorer: Optional[Callable[[str, int], float]] = None,
+                 min_score: float = 0.7, recover_after: int = 2, anchor: int = 2, reach: int = 200):
+        self.encode = encode
+        self.scorer = scorer
+        self.min_score = min_score
+        self.ignored_id = ignored_id
+        self.reference = list(reference_ids)
+        self.end = len(self.reference)
+        while self.end and self.reference[self.end - 1] == ignored_id:
+            self.end -= 1
+        self.lookahead = lookahead
+        self.recover_after = recover_after
+        self.anchor = anchor
+        self.reach = reach
+        self.cursor = 0
+        self.missed: Tuple[int, ...] = ()
+        self._anchors: Optional[Dict[tuple, List[Tuple[int, int]]]] = None
+
+        self._segment_id: Optional[Hashable] = None
+        self._segment_text = ''
+        self._segment_base = 0
+        self._segment_missed: Tuple[int, ...] = ()
+        self._tokens: List[int] = []
+        self._words: List[str] = []
+        self._cursors: List[int] = []
+        self._missed: List[Tuple[int, ...]] = []
+
+    def finished(self) -> bool:
+        return self.cursor >= self.end
+
+    def update(self, segment_id: Hashable, words: Sequence[str], text: str = '') -> List[Tuple[int, Optional[float]]]:
+        events = []
+
+        if segment_id != self._segment_id:
+            self._segment_id = segment_id
+            self._segment_base = self.cursor
+            self._segment_missed = self.missed
+            self._tokens = []
+            self._words = []
+            self._cursors = []
+            self._missed = []
+            self._segment_text = ''
+
+        previous = self._segment_text
+        if text and previous and text.startswith(previous):
+            boundary = text[len(previous):len(previous) + 1]
+            common = len(self._tokens) if not boundary or boundary.isspace() else max(len(self._tokens) - 1, 0)
+        else:
+            common = 0
+            limit = min(len(self._tokens), len(words))
+            while common < limit and self._words[common] == words[common]:
+                common += 1
+        self._segment_text = text
+
+        if common < len(self._tokens):
+            rollback = self._cursors[common - 1] if common else self._segment_base
+            for ref_index in range(rollback, min(self.cursor + 1, len(self.reference))):
+                events.append((ref_index, None))
+            self.cursor = rollback
+            self.missed = self._missed[common - 1] if common else self._segment_missed
+            del self._tokens[common:]
+            del self._words[common:]
+            del self._cursors[common:]
+            del self._missed[common:]
+
+        for word in words[len(self._tokens):]:
+            token = self.encode(word)
+            self._tokens.append(token)
+            self._words.append(word)
+            self._advance(token, word, events)
+            self._cursors.append(self.cursor)
+            self._missed.append(self.missed)
+
+        return events
+
+    def _advance(self, token: int, word: str, events: List[Tuple[int, Optional[float]]]):
+        reference = self.reference
+        cursor = self.cursor
+        while cursor < len(reference) and reference[cursor] == self.ignored_id:
+            cursor += 1
+        self.cursor = cursor
+        if cursor >= len(reference):
+            return
+
+        if token == reference[cursor]:
+            events.append((cursor, 1.0))
+            self.cursor = cursor + 1
+            self.missed = ()
+            return
+
+        end = min(cursor + 1 + self.lookahead, len(reference))
+        for ref_index in range(cursor + 1, end):
+            if reference[ref_index] == token:
+                for skipped in range(cursor, ref_index):
+                    events.append((skipped, 0.0))
+                events.append((ref_index, 1.0))
+                self.cursor = ref_index + 1
+                self.missed = ()
+                return
+
+        self.missed = (self.missed + (token,))[-max(self.recover_after, self.anchor):]
+        if len(self.missed) >= self.recover_after and self._resync(events):
+            return
+
+        start = max(cursor - self.lookahead, 0)
+        if token in reference[start:cursor]:
+            return
+
+        if self.scorer is not None:
+            score = self.scorer(word, cursor)
+            if score >= self.min_score:
+                events.append((cursor, score))
+                self.cursor = cursor + 1
+                self.missed = ()
+                return
+
+        events.append((cursor, 0.0))
+
+    def _anchor_index(self) -> Dict[tuple, List[Tuple[int, int]]]:
+        if self._anchors is None:
+            kept = [k for k, token in enumerate(self.reference) if token != self.ignored_id]
+            self._anchors = {}
+            for k in range(len(kept) - self.anchor + 1):
+                gram = tuple(self.reference[i] for i in kept[k:k + self.anchor])
+                self._anchors.setdefault(gram, []).append((kept[k], kept[k + self.anchor - 1]))
+        return self._anchors
+
+    def _resync(self, events: List[Tuple[int, Optional[float]]]) -> bool:
+        if len(self.missed) < self.anchor:
+            return False
+        spans = self._anchor_index().get(self.missed[-self.anchor:])
+        if not spans:
+            return False
+        k = bisect_right(spans, (self.cursor, -1))
+        if k == len(spans) or spans[k][0] - self.cursor > self.reach:
+            return False
+        if k and self.cursor - spans[k - 1][1] <= spans[k][0] - self.cursor:
+            return False
+        first, last = spans[k]
+        for skipped in range(self.cursor, first):
+            if self.reference[skipped] != self.ignored_id:
+                events.append((skipped, 0.0))
+        for ref_index in range(first, last + 1):
+            if self.reference[ref_index] != self.ignored_id:
+                events.append((ref_index, 1.0))
+        self.cursor = last + 1
+        self.missed = ()
+        return True
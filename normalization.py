@@ -0,0 +1,29 @@
+import re
+import string
+from functools import lru_cache
+from typing import List
+
+_CASEFOLD = {ord('I'): 'ı', ord('İ'): 'i'}
+_PUNCTUATION = string.punctuation + '“”‘’«»‹›…–—'
+_NORMALIZE_TABLE = {**_CASEFOLD, **{ord(c): None for c in _PUNCTUATION}}
+_NON_WORD_RE = re.compile(r'[^\w]')
+
+
+def turkish_lower(text: str) -> str:
+    return text.translate(_CASEFOLD).lower()
+
+
+@lru_cache(maxsize=65536)
+def normalize_word(word: str) -> str:
+    normalized = word.translate(_NORMALIZE_TABLE).lower()
+    if not normalized.isalnum():
+        normalized = _NON_WORD_RE.sub('', normalized)
+    return normalized
+
+
+def normalize_words(words) -> List[str]:
+    return [normalize_word(w) for w in words]
+
+
+def normalize_text(text: str) -> List[str]:
+    return [n for n in (normalize_word(w) for w in text.split()) if n]
@@ -0,0 +1,184 @@
+import json
+import sqlite3
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+from normalization import normalize_word
+
+SAMPLE_PASSAGES = [
+    {
+        'title': "Kısa Metin (Kolay)",
+        'level': 1,
+        'topic': 'doğa',
+        'text': "Küçük kedi bahçede oyun oynuyor. Renkli bir kelebek gördü ve peşinden koştu."
+    },
+    {
+        'title': "Orta Metin",
+        'level': 2,
+        'topic': 'okul',
+        'text': "Ali okula giderken yolda arkadaşı Ayşe'yi gördü. Birlikte yürümeye başladılar. "
+                "Hava çok güzeldi ve kuşlar ötüyordu."
+    },
+    {
+        'title': "Uzun Metin (Zor)",
+        'level': 3,
+        'topic': 'aile',
+        'text': "Geçen hafta sonu ailemle birlikte pikniğe gittik. Yeşil çimenlerin üzerine battaniyemizi serdik. "
+                "Annem lezzetli sandviçler hazırlamıştı. Kardeşim top oynamak istedi ve hep beraber oynadık."
+    }
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS passages (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    topic TEXT NOT NULL DEFAULT '',
+    word_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS passage_bodies (
+    passage_id INTEGER PRIMARY KEY REFERENCES passages(id) ON DELETE CASCADE,
+    body TEXT NOT NULL,
+    tokens TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_passages_level ON passages(level, word_count, id);
+CREATE INDEX IF NOT EXISTS idx_passages_topic ON passages(topic, level, word_count, id);
+"""
+
+
+def tokenize_passage(body: str):
+    tokens = body.split()
+    return {
+        'tokens': tokens,
+        'normalized': [normalize_word(token) for token in tokens]
+    }
+
+
+class PassageLibrary:
+    def __init__(self, path: str = 'passages.db', cache_size: int = 32):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[int, dict]" = OrderedDict()
+
+        if self.db.execute("SELECT 1 FROM passages LIMIT 1").fetchone() is None:
+            self.add_many(SAMPLE_PASSAGES)
+
+    def add(self, title: str, text: str, level: int = 1, topic: str = '') -> int:
+        return self.add_many([{'title': title, 'text': text, 'level': level, 'topic': topic}])[0]
+
+    def add_many(self, passages: Sequence[dict]) -> List[int]:
+        ids = []
+        with self.db:
+            for passage in passages:
+                body = passage['text'].strip()
+                cache = tokenize_passage(body)
+                cursor = self.db.execute(
+                    "INSERT INTO passages (title, level, topic, word_count) VALUES (?, ?, ?, ?)",
+                    (passage['title'], int(passage.get('level', 1)), passage.get('topic', ''), len(cache['tokens']))
+                )
+                self.db.execute(
+                    "INSERT INTO passage_bodies (passage_id, body, tokens) VALUES (?, ?, ?)",
+                    (cursor.lastrowid, body, json.dumps(cache, ensure_ascii=False))
+                )
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def _distinct(self, column: str) -> list:
+        values = []
+        value = self.db.execute(f"SELECT MIN({column}) FROM passages").fetchone()[0]
+        while value is not None:
+            values.append(value)
+            value = self.db.execute(f"SELECT MIN({column}) FROM passages WHERE {column} > ?", (value,)).fetchone()[0]
+        return values
+
+    def levels(self) -> List[int]:
+        return self._distinct('level')
+
+    def topics(self) -> List[str]:
+        return self._distinct('topic')
+
+    @staticmethod
+    def _filters(level, topic, max_words):
+        clauses, params = [], []
+        if level is not None:
+            clauses.append("level = ?")
+            params.append(level)
+        if topic:
+            clauses.append("topic = ?")
+            params.append(topic)
+        if max_words is not None:
+            clauses.append("word_count <= ?")
+            params.append(max_words)
+        return clauses, params
+
+    def page(self, limit: int = 10, after: Optional[Tuple[int, int, int]] = None, level: Optional[int] = None,
+             topic: Optional[str] = None, max_words: Optional[int] = None) -> List[dict]:
+        clauses, params = self._filters(level, topic, max_words)
+        if after is not None and level is not None:
+            clauses.append("(word_count, id) > (?, ?)")
+            params.extend(after[1:])
+        elif after is not None:
+            clauses.append("(level, word_count, id) > (?, ?, ?)")
+            params.extend(after)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.db.execute(
+            f"SELECT id, title, level, topic, word_count FROM passages {where} "
+            f"ORDER BY level, word_count, id LIMIT ?",
+            (*params, limit)
+        )
+        return [dict(row) for row in rows]
+
+    def count(self, level: Optional[int] = None, topic: Optional[str] = None, max_words: Optional[int] = None) -> int:
+        clauses, params = self._filters(level, topic, max_words)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self.db.execute(f"SELECT COUNT(*) FROM passages {where}", params).fetchone()[0]
+
+    def load(self, passage_id: int) -> Optional[dict]:
+        passage = self._cache.get(passage_id)
+        if passage is not None:
+            self._cache.move_to_end(passage_id)
+            return passage
+
+        row = self.db.execute(
+            "SELECT p.id, p.title, p.level, p.topic, p.word_count, b.body, b.tokens "
+            "FROM passages p JOIN passage_bodies b ON b.passage_id = p.id WHERE p.id = ?",
+            (passage_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        passage = dict(row)
+        cache = json.loads(passage.pop('tokens'))
+        passage['tokens'] = cache['tokens']
+        passage['normalized'] = cache['normalized']
+
+        self._cache[passage_id] = passage
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return passage
+
+    def close(self):
+        self.db.close()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Import graded passages into the passage library')
+    parser.add_argument('passages', help='JSONL with title, text, level and topic per line')
+    parser.add_argument('--db', default='passages.db')
+    args = parser.parse_args()
+
+    with open(args.passages, 'r', encoding='utf-8') as f:
+        passages = [json.loads(line) for line in f if line.strip()]
+    library = PassageLibrary(args.db)
+    library.add_many(passages)
+    print(f"{len(passages)} passages imported, {library.count()} in library")
+    library.close()
+
+
+if __name__ == "__main__":
+    main()
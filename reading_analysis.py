@@ -0,0 +1,128 @@
+from alignment import TokenVocabulary, align_words, MATCH, SUBSTITUTION, INSERTION
+from disfluency import (DisfluencyTracker, FillerDetector, PartWordRestartDetector, RepetitionDetector,
+                        SyllableRepetitionDetector)
+from fuzzy_match import similarity
+from normalization import normalize_text, normalize_word
+
+
+def tokenize_text(text: str):
+    return text.strip().split()
+
+
+def remove_punctuation_and_lowercase(text):
+    return " ".join(normalize_text(text))
+
+
+def encode_reference(reference_words, vocabulary: TokenVocabulary):
+    return [vocabulary.intern(normalize_word(w)) for w in reference_words]
+
+
+def detect_stuttering(segments, reference_words=()):
+    tracker = DisfluencyTracker(known_words=(normalize_word(w) for w in reference_words))
+    for segment in segments:
+        tracker.process_segment(segment)
+    return tracker.events
+
+
+def hesitation_positions(hesitations, spoken_words, starts):
+    by_time = {}
+    for k, start in enumerate(starts):
+        by_time.setdefault(round(float(start), 2), []).append(k)
+
+    positions = set()
+    for event in hesitations:
+        for k in by_time.get(event['timestamp'], ()):
+            if event['type'] in (FillerDetector.kind, RepetitionDetector.kind):
+                if spoken_words[k] == normalize_word(event['word']):
+                    positions.add(k)
+            elif event['type'] in (SyllableRepetitionDetector.kind, PartWordRestartDetector.kind):
+                if spoken_words[k] == normalize_word(event['word'].split('-')[-1]):
+                    positions.update(range(max(k - event['word'].count('-'), 0), k))
+    return positions
+
+
+def analyze_reading(segments, reference_words, hesitations=None, vocabulary=None, reference_ids=None):
+    from word_timing import WordTimeline, timed_words, timing_report
+
+    analysis = {
+        'hesitations': [],
+        'pauses': [],
+        'mispronunciations': [],
+        'misreadings': [],
+        'omissions': [],
+        'word_confidence': [],
+        'timing': None,
+        'reading_speed': 0.0,
+        'accuracy': 0.0,
+        'start_time': 0.0
+    }
+
+    spoken_words, starts, ends = timed_words(segments)
+
+    if vocabulary is None:
+        vocabulary = TokenVocabulary()
+        reference_ids = encode_reference(reference_words, vocabulary)
+    empty_id = vocabulary.ids.get('')
+    ref_positions = [i for i, token_id in enumerate(reference_ids) if token_id != empty_id]
+    ref_ids = [reference_ids[i] for i in ref_positions]
+
+    if not spoken_words:
+        return analysis
+
+    analysis['start_time'] = float(segments[0]['start'])
+    total_time = float(segments[-1]['end']) - analysis['start_time']
+    if total_time > 0:
+        analysis['reading_speed'] = len(spoken_words) / (total_time / 60)
+    else:
+        analysis['reading_speed'] = 0
+
+    for i in range(len(segments) - 1):
+        pause_duration = float(segments[i + 1]['start']) - float(segments[i]['end'])
+        if pause_duration > 1.0:
+            analysis['pauses'].append({
+                'duration': round(pause_duration, 2),
+                'position': segments[i]['text']
+            })
+
+    analysis['hesitations'] = detect_stuttering(segments, reference_words) if hesitations is None else hesitations
+
+    hesitant = hesitation_positions(analysis['hesitations'], spoken_words, starts)
+    kept = [k for k in range(len(spoken_words)) if k not in hesitant]
+    alignment = align_words(ref_ids, vocabulary.lookup([spoken_words[k] for k in kept]))
+    ops = alignment['ops']
+    if hesitant:
+        ops = [(op, ref_index, None if spoken_index is None else kept[spoken_index])
+               for op, ref_index, spoken_index in ops]
+
+    scores = [0.0] * len(ref_ids)
+    spoken_for = [None] * len(ref_ids)
+    for op, ref_index, spoken_index in ops:
+        if op == MATCH:
+            scores[ref_index] = 1.0
+        elif op in (SUBSTITUTION, INSERTION):
+            spoken_word = spoken_words[spoken_index]
+            reference_word = None
+            if op == SUBSTITUTION:
+                reference_word = normalize_word(reference_words[ref_positions[ref_index]])
+                scores[ref_index] = similarity(reference_word, spoken_word)
+            analysis['mispronunciations'].append(spoken_word)
+            analysis['misreadings'].append({
+                'spoken': spoken_word,
+                'reference': reference_word,
+                'timestamp': round(float(starts[spoken_index]), 2)
+            })
+        if spoken_index is not None and ref_index is not None:
+            spoken_for[ref_index] = spoken_words[spoken_index]
+    analysis['word_confidence'] = [
+        {'index': position, 'word': reference_words[position], 'spoken': spoken_for[i], 'score': round(scores[i], 2)}
+        for i, position in enumerate(ref_positions)
+    ]
+    analysis['omissions'] = [normalize_word(reference_words[ref_positions[i]]) for i in alignment['omissions']]
+
+    timeline = WordTimeline.from_alignment(starts, ends, ops)
+    analysis['timing'] = timing_report(timeline, [reference_words[p] for p in ref_positions], ref_positions)
+
+    if ref_ids:
+        analysis['accuracy'] = alignment['accuracy']
+
+    return analysis
@@ -0,0 +1,163 @@
+import json
+import os
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from fuzzy_match import confidence_tag
+from hallucination_filter import DEFAULT_PHRASES
+from normalization import normalize_word
+
+CONFIG_PATH = 'config.json'
+COLLAPSE_AFTER = 8
+MAX_TIMESTAMPS = 3
+
+DEFAULT_CONFIG = {
+    "host": "localhost",
+    "port": 9090,
+    "model": "large-v3-turbo",
+    "lang": "tr",
+    "use_vad": False,
+    "client_vad": True,
+    "word_timestamps": True,
+    "hallucination_phrases": DEFAULT_PHRASES
+}
+
+
+def load_config(path: str = CONFIG_PATH) -> dict:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        config = dict(DEFAULT_CONFIG)
+        save_config(config, path)
+        return config
+
+
+def save_config(config: dict, path: str = CONFIG_PATH):
+    with open(path, 'w') as f:
+        json.dump(config, f)
+
+
+def prepare_reference(reference_text: str, passage: Optional[dict] = None):
+    if passage is not None and passage['body'] == reference_text:
+        return passage['tokens'], passage['normalized']
+    return reference_text.split(), None
+
+
+def transcript_edit(shown: str, text: str) -> Tuple[int, str]:
+    if text.startswith(shown):
+        common = len(shown)
+    else:
+        common = len(os.path.commonprefix([shown, text]))
+    return common, text[common:]
+
+
+def format_timestamp(seconds: float) -> str:
+    minutes, seconds = divmod(max(int(seconds), 0), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def group_events(events: Sequence[dict], key: Callable[[dict], Hashable], start_time: float = 0.0) -> List[dict]:
+    groups: Dict[Hashable, dict] = {}
+    for event in events:
+        name = key(event)
+        group = groups.get(name)
+        if group is None:
+            groups[name] = group = {'key': name, 'count': 0, 'timestamps': []}
+        group['count'] += 1
+        if event.get('timestamp') is not None:
+            group['timestamps'].append(event['timestamp'] - start_time)
+    return sorted(groups.values(), key=lambda group: -group['count'])
+
+
+def occurrences(group: dict) -> str:
+    times = ", ".join(format_timestamp(t) for t in group['timestamps'][:MAX_TIMESTAMPS])
+    if len(group['timestamps']) > MAX_TIMESTAMPS:
+        times += ", …"
+    count = f" ×{group['count']}" if group['count'] > 1 else ""
+    return f"{count} ({times})" if times else count
+
+
+class ReportBuilder:
+    def __init__(self, collapse_after: int = COLLAPSE_AFTER):
+        self.collapse_after = collapse_after
+        self.chunks: List = []
+        self.sections: Dict[str, str] = {}
+
+    def add(self, text: str, *tags: str):
+        self.chunks.extend((text, tags))
+
+    def section(self, title: str, lines: List[str], tag: str):
+        if not lines:
+            return
+        self.add(title, 'purple')
+        self.add("".join(lines[:self.collapse_after]), tag)
+        hidden = lines[self.collapse_after:]
+        if hidden:
+            toggle, body = f"toggle_{len(self.sections)}", f"section_{len(self.sections)}"
+            self.add(f"  ▸ {len(hidden)} tane daha (göster/gizle)\n", 'toggle', toggle)
+            self.add("".join(hidden), tag, body)
+            self.sections[toggle] = body
+
+    def result(self) -> dict:
+        return {'chunks': self.chunks, 'sections': self.sections}
+
+
+def build_report(analysis: dict, collapse_after: int = COLLAPSE_AFTER) -> dict:
+    report = ReportBuilder(collapse_after)
+    report.add("🌈 OKUMA RAPORUM 🌈\n\n", 'purple')
+    report.add("🎯 Nasıl Okudum?\n", 'blue_bold')
+
+    accuracy = analysis['accuracy']
+    speed = analysis['reading_speed']
+    start_time = analysis.get('start_time', 0.0)
+
+    if accuracy >= 90:
+        report.add(f"🟢 Doğruluk: %{accuracy:.1f} - Harika okudun! Çok başarılısın! 🏆\n", 'green')
+    elif accuracy >= 70:
+        report.add(f"🟡 Doğruluk: %{accuracy:.1f} - İyi iş çıkardın! Biraz daha pratik yapalım! 👍\n", 'yellow')
+    else:
+        report.add(f"🔴 Doğruluk: %{accuracy:.1f} - Birlikte daha çok çalışalım! 💪\n", 'red')
+
+    report.add(f"📚 Hızım: Dakikada {speed:.1f} kelime\n", 'blue')
+
+    timing = analysis.get('timing')
+    if timing:
+        report.add(f"✅ Doğru Okuma Hızım: Dakikada {timing['correct_words_per_minute']:.1f} kelime\n", 'blue')
+        pauses = timing['pauses']
+        if pauses['count']:
+            report.add(f"⏸️ {pauses['count']} kez durakladım (toplam {pauses['total']:.1f} sn)\n", 'blue')
+    report.add("\n")
+
+    misreadings = analysis.get('misreadings')
+    if misreadings is None:
+        misreadings = [{'spoken': word, 'reference': None} for word in analysis['mispronunciations']]
+    near_misses = [w for w in analysis.get('word_confidence', []) if confidence_tag(w['score']) == 'med_conf']
+
+    if analysis['hesitations'] or misreadings:
+        report.add("🎯 Geliştirebileceğim Noktalar:\n", 'blue_bold')
+
+        lines = []
+        for group in group_events(analysis['hesitations'], lambda h: (h['word'], h['type']), start_time):
+            word, kind = group['key']
+            lines.append(f"• {word} ({kind}){occurrences(group)}\n")
+        report.section("🗣️ Tekrarladığım Kelimeler:\n", lines, 'yellow')
+
+        lines = []
+        for group in group_events(misreadings, lambda m: (m['reference'], m['spoken']), start_time):
+            reference, spoken = group['key']
+            target = f"→ {reference}" if reference else "(fazladan)"
+            lines.append(f"• {spoken} {target}{occurrences(group)}\n")
+        report.section("📝 Yanlış Okuduğum Kelimeler:\n", lines, 'red')
+
+        lines = []
+        for group in group_events(near_misses, lambda w: (normalize_word(w['word']), w['spoken'], w['score'])):
+            word, spoken, score = group['key']
+            lines.append(f"• {spoken} → {word} (%{score * 100:.0f}){occurrences(group)}\n")
+        report.section("🟠 Az Kalsın Doğru Okuduklarım:\n", lines, 'yellow')
+
+    if timing:
+        report.section("⏳ Önünde Durakladığım Kelimeler:\n", [
+            f"• {w['word']} ({w['seconds']:.1f} sn)\n" for w in timing['hesitation_words']
+        ], 'yellow')
+
+    return report.result()
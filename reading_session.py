@@ -0,0 +1,141 @@
+import queue
+import threading
+from typing import Callable, List, Optional, Sequence
+
+from disfluency import DisfluencyTracker
+from fuzzy_match import ReferenceScorer
+from hallucination_filter import HallucinationFilter, IncrementalFilter
+from latency_metrics import metrics
+from live_matcher import IncrementalMatcher
+from alignment import TokenVocabulary
+from normalization import normalize_word
+from reading_analysis import analyze_reading, tokenize_text
+
+DEFAULT_FILTER = HallucinationFilter()
+
+
+def _noop(*args):
+    pass
+
+
+class ReadingSession:
+    def __init__(self, reference_words: Sequence[str],
+                 on_highlight: Callable[[int, Optional[float]], None] = _noop,
+                 on_transcript: Callable[[str], None] = _noop,
+                 on_finished: Callable[[], None] = _noop,
+                 hallucination_filter: Optional[HallucinationFilter] = None,
+                 normalized_words: Optional[Sequence[str]] = None):
+        self.reference_words = list(reference_words)
+        self.on_highlight = on_highlight
+        self.on_transcript = on_transcript
+        self.on_finished = on_finished
+        self.hallucination_filter = hallucination_filter or DEFAULT_FILTER
+        self.cleaner = IncrementalFilter(self.hallucination_filter)
+
+        if normalized_words is None:
+            normalized_words = [normalize_word(w) for w in self.reference_words]
+        self.vocabulary = TokenVocabulary()
+        self.reference_ids = self.vocabulary.encode(normalized_words)
+        self.scorer = ReferenceScorer(normalized_words)
+        self.live_matcher = IncrementalMatcher(self.reference_ids, self.encode,
+                                               ignored_id=self.vocabulary.ids.get(''), scorer=self.scorer)
+        self.disfluency_tracker = DisfluencyTracker(known_words=normalized_words)
+        self.all_segments: List[dict] = []
+        self.pending_segment: Optional[dict] = None
+
+        self.lock = threading.RLock()
+        self.inbox: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._scheduled = False
+        self._schedule_lock = threading.Lock()
+
+    def encode(self, word: str) -> int:
+        return self.vocabulary.ids.get(normalize_word(word), -1)
+
+    @property
+    def next_word_index(self) -> int:
+        return self.live_matcher.cursor
+
+    def clean_segment(self, segment: dict) -> Optional[dict]:
+        text = self.cleaner.clean(segment['start'], segment['text'])
+        if not text.strip():
+            return None
+        if text is segment['text']:
+            return segment
+        return dict(segment, text=text)
+
+    def submit(self, finalized, pending) -> bool:
+        self.inbox.put((finalized, pending, metrics.now()))
+        with self._schedule_lock:
+            if self._scheduled:
+                return False
+            self._scheduled = True
+            return True
+
+    def drain(self) -> int:
+        drained = 0
+        while True:
+            batch = []
+            while True:
+                try:
+                    batch.append(self.inbox.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                with self._schedule_lock:
+                    if self.inbox.empty():
+                        self._scheduled = False
+                        return drained
+                continue
+
+            finalized = [segment for item in batch for segment in item[0]]
+            pending = next((item[1] for item in reversed(batch) if item[1] is not None), None)
+            started = metrics.now()
+            self.handle_transcript(finalized, pending)
+            drained += len(batch)
+            if metrics.enabled:
+                finished = metrics.now()
+                for _, _, queued in batch:
+                    metrics.record('session_queue', started - queued)
+                metrics.record('session_drain', finished - started)
+
+    def handle_transcript(self, finalized, pending):
+        with self.lock:
+            self._handle_transcript(finalized, pending)
+
+    def _handle_transcript(self, finalized, pending):
+        for segment in finalized:
+            if self.pending_segment is not None and segment['start'] >= self.pending_segment['start']:
+                self.pending_segment = None
+            segment = self.clean_segment(segment)
+            if segment is not None:
+                self.all_segments.append(segment)
+                self.disfluency_tracker.process_segment(segment)
+                self.match_segment(segment)
+
+        if pending is not None:
+            pending = self.clean_segment(pending)
+            self.pending_segment = pending
+            if pending is not None:
+                self.on_transcript(pending['text'].strip())
+                self.match_segment(pending)
+
+        if self.live_matcher.finished():
+            self.on_finished()
+
+    def match_segment(self, segment):
+        text = segment['text'].strip()
+        for word_index, score in self.live_matcher.update(segment['start'], tokenize_text(text), text):
+            self.on_highlight(word_index, score)
+
+    def finish(self) -> List[dict]:
+        with self.lock:
+            if self.pending_segment is not None:
+                self.all_segments.append(self.pending_segment)
+                self.disfluency_tracker.process_segment(self.pending_segment)
+                self.pending_segment = None
+            return self.all_segments
+
+    def analyze(self):
+        with self.lock:
+            return analyze_reading(self.finish(), self.reference_words, self.disfluency_tracker.events,
+                                   self.vocabulary, self.reference_ids)
@@ -0,0 +1,102 @@
+import bisect
+import re
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from fuzzy_match import confidence_tag
+from text_positions import build_token_index
+
+_TOKEN_RE = re.compile(r'\S+')
+
+CODE_TAGS = (None, 'high_conf', 'med_conf', 'low_conf')
+TAG_CODES = {tag: code for code, tag in enumerate(CODE_TAGS) if tag}
+
+
+def token_offsets(text: str) -> Tuple[array, array]:
+    starts, ends = array('l'), array('l')
+    for match in _TOKEN_RE.finditer(text):
+        starts.append(match.start())
+        ends.append(match.end())
+    return starts, ends
+
+
+def paginate(text: str, starts: array, ends: array, page_words: int = 150) -> List[int]:
+    count = len(starts)
+    pages = [0]
+    while pages[-1] + page_words < count:
+        cut = pages[-1] + page_words
+        limit = min(cut + page_words, count)
+        index = cut
+        while index < limit and text.find('\n', ends[index - 1], starts[index]) < 0:
+            index += 1
+        pages.append(index if index < limit else cut)
+    return pages
+
+
+class ReadingWindow:
+    def __init__(self, text: str, page_words: int = 150, pages_around: int = 1):
+        self.text = text
+        self.pages_around = pages_around
+        self.starts, self.ends = token_offsets(text)
+        self.page_starts = paginate(text, self.starts, self.ends, page_words)
+        self.highlights = bytearray(len(self.starts))
+        self.page = -1
+        self.first_token = 0
+        self.positions: List[Tuple[str, str]] = []
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_starts)
+
+    @property
+    def complete(self) -> bool:
+        return self.first_token == 0 and len(self.positions) == len(self)
+
+    def page_of(self, index: int) -> int:
+        return bisect.bisect_right(self.page_starts, index) - 1
+
+    def needs_render(self, next_index: int) -> bool:
+        return self.page_of(min(next_index, max(len(self) - 1, 0))) != self.page
+
+    def render(self, next_index: int = 0) -> str:
+        self.page = self.page_of(min(next_index, max(len(self) - 1, 0)))
+        if not len(self):
+            self.first_token, self.positions = 0, []
+            return self.text
+        first_page = max(self.page - self.pages_around, 0)
+        last_page = min(self.page + self.pages_around + 1, self.page_count)
+        self.first_token = self.page_starts[first_page]
+        last_token = self.page_starts[last_page] if last_page < self.page_count else len(self)
+        shown = self.text[self.starts[self.first_token]:self.ends[last_token - 1]]
+        self.positions = build_token_index(shown)[1]
+        return shown
+
+    def position(self, index: int) -> Optional[Tuple[str, str]]:
+        local = index - self.first_token
+        if 0 <= local < len(self.positions):
+            return self.positions[local]
+        return None
+
+    def update(self, highlights: Dict[int, Optional[float]]) -> Dict[int, Optional[float]]:
+        visible = {}
+        for index, score in highlights.items():
+            if 0 <= index < len(self.highlights):
+                self.highlights[index] = TAG_CODES.get(confidence_tag(score), 0)
+                if self.position(index) is not None:
+                    visible[index] = score
+        return visible
+
+    def tag_ranges(self) -> Dict[str, List[str]]:
+        ranges = {tag: [] for tag in TAG_CODES}
+        window = self.highlights[self.first_token:self.first_token + len(self.positions)]
+        for local, code in enumerate(window):
+            if code:
+                ranges[CODE_TAGS[code]].extend(self.positions[local])
+        return ranges
+
+    def reset(self):
+        self.highlights = bytearray(len(self.starts))
+        self.page = -1
@@ -0,0 +1,87 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from latency_metrics import metrics
+
+
+class RenderScheduler:
+    def __init__(self, root, render: Callable[[Dict[int, Optional[float]], Optional[str]], None], fps: int = 30):
+        self.root = root
+        self.render = render
+        self.frame_interval = 1.0 / fps
+
+        self._lock = threading.Lock()
+        self._highlights: Dict[int, Optional[float]] = {}
+        self._transcript: Optional[str] = None
+        self._scheduled = False
+        self._scheduled_at = 0.0
+        self._last_flush = 0.0
+        self._arrivals: Dict[int, float] = {}
+
+        self.updates = 0
+        self.merged = 0
+        self.flushes = 0
+
+    def highlight(self, word_index: int, score: Optional[float]):
+        with self._lock:
+            self.updates += 1
+            if word_index in self._highlights:
+                self.merged += 1
+            self._highlights[word_index] = score
+            if metrics.enabled:
+                self._arrivals.setdefault(word_index, metrics.current_arrival)
+            self._schedule()
+
+    def transcript(self, text: str):
+        with self._lock:
+            self.updates += 1
+            if self._transcript is not None:
+                self.merged += 1
+            self._transcript = text
+            self._schedule()
+
+    def _schedule(self):
+        if self._scheduled:
+            return
+        self._scheduled = True
+        self._scheduled_at = time.monotonic()
+        delay = self._last_flush + self.frame_interval - time.monotonic()
+        self.root.after(max(int(delay * 1000), 0), self.flush)
+
+    def flush(self):
+        with self._lock:
+            highlights, self._highlights = self._highlights, {}
+            transcript, self._transcript = self._transcript, None
+            arrivals, self._arrivals = self._arrivals, {}
+            scheduled_at = self._scheduled_at if self._scheduled else None
+            self._scheduled = False
+            self._last_flush = time.monotonic()
+
+        if highlights or transcript is not None:
+            self.flushes += 1
+            if not metrics.enabled:
+                self.render(highlights, transcript)
+                return
+
+            started = metrics.now()
+            if scheduled_at is not None:
+                metrics.record('tk_after_queue', self._last_flush - scheduled_at)
+            self.render(highlights, transcript)
+            finished = metrics.now()
+            metrics.record('highlight_render', finished - started)
+            for arrived in arrivals.values():
+                if arrived:
+                    metrics.record('message_to_highlight', finished - arrived)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'updates': self.updates,
+                'merged': self.merged,
+                'flushes': self.flushes
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.updates = self.merged = self.flushes = 0
@@ -0,0 +1,115 @@
+import argparse
+import json
+import threading
+import time
+
+from latency_metrics import metrics
+from reading_analysis import tokenize_text
+from reading_session import ReadingSession
+from render_scheduler import RenderScheduler
+from standin_server import StandInServer, load_script
+
+
+class HeadlessRoot:
+    def after(self, ms, func, *args):
+        timer = threading.Timer(ms / 1000, func, args)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+
+def percentile(values, fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def replay_session(script_path: str, reference_text: str, speed: float = 0.0, timeout: float = 600.0, fps: int = 30):
+    from capture_client import CaptureClient
+
+    script = load_script(script_path)
+    server = StandInServer(script, host='localhost', port=0, speed=speed)
+    server.start()
+
+    arrivals = {}
+    latencies = []
+    state = {'arrived': 0.0, 'messages': 0}
+    done = threading.Event()
+
+    def render(highlights, transcript):
+        now = time.perf_counter()
+        for word_index in highlights:
+            arrived = arrivals.pop(word_index, None)
+            if arrived is not None:
+                latencies.append(now - arrived)
+
+    scheduler = RenderScheduler(HeadlessRoot(), render, fps=fps)
+
+    def on_highlight(word_index, score):
+        arrivals.setdefault(word_index, state['arrived'])
+        scheduler.highlight(word_index, score)
+
+    session = ReadingSession(tokenize_text(reference_text), on_highlight=on_highlight,
+                             on_transcript=scheduler.transcript)
+
+    class ReplayClient(CaptureClient):
+        def on_message(self, ws, message):
+            super().on_message(ws, message)
+            if self.ready_notified and not self.recording:
+                done.set()
+
+        def process_segments(self, segments):
+            state['arrived'] = time.perf_counter()
+            state['messages'] += 1
+            super().process_segments(segments)
+
+    started = time.perf_counter()
+    client = ReplayClient(host='localhost', port=server.port, lang='tr', translate=False,
+                          model='stand-in', use_vad=False, text_callback=session.handle_transcript)
+    done.wait(timeout)
+    elapsed = time.perf_counter() - started
+    scheduler.flush()
+
+    try:
+        client.close_websocket()
+    except Exception:
+        pass
+    server.shutdown()
+
+    analysis = session.analyze()
+    return {
+        'messages': state['messages'],
+        'elapsed': round(elapsed, 4),
+        'messages_per_second': round(state['messages'] / elapsed, 1) if elapsed > 0 else 0.0,
+        'highlight_latency_ms': {
+            'p50': round(percentile(latencies, 0.50) * 1000, 3),
+            'p95': round(percentile(latencies, 0.95) * 1000, 3),
+            'p99': round(percentile(latencies, 0.99) * 1000, 3),
+            'max': round(max(latencies, default=0.0) * 1000, 3)
+        },
+        'render': scheduler.stats(),
+        'accuracy': round(analysis['accuracy'], 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay recorded server messages through the live reading path')
+    parser.add_argument('script', help='JSONL recording written by CaptureClient(record_path=...)')
+    parser.add_argument('reference', help='reference text file')
+    parser.add_argument('--speed', type=float, default=0.0, help='1 = real time, N = N times faster, 0 = maximum')
+    parser.add_argument('--metrics', help='enable per-stage latency metrics and append them to this file')
+    args = parser.parse_args()
+
+    if args.metrics:
+        metrics.enable()
+
+    with open(args.reference, 'r', encoding='utf-8') as f:
+        reference_text = f.read()
+    print(json.dumps(replay_session(args.script, reference_text, args.speed), ensure_ascii=False))
+    if args.metrics:
+        metrics.dump(args.metrics)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import json
+import threading
+import time
+from collections import deque
+from typing import List, Optional, Tuple
+
+
+def parse_segment(raw: dict) -> dict:
+    segment = dict(raw)
+    segment['start'] = float(raw['start'])
+    segment['end'] = float(raw['end'])
+    segment['text'] = raw['text']
+    return segment
+
+
+class SegmentStore:
+    def __init__(self, max_finalized: int = 500, spill_path: Optional[str] = None):
+        self.finalized = deque(maxlen=max_finalized)
+        self.pending: Optional[dict] = None
+        self.finalized_end = float('-inf')
+        self.finalized_count = 0
+        self.spill_path = spill_path
+        self._spill = None
+
+    def update(self, raw_segments: list) -> Tuple[List[dict], Optional[dict]]:
+        new_finalized = []
+        last = len(raw_segments) - 1
+        for index, raw in enumerate(raw_segments):
+            if index == last and not raw.get('completed'):
+                break
+            start = float(raw['start'])
+            if start < self.finalized_end:
+                continue
+            segment = parse_segment(raw)
+            self.finalized.append(segment)
+            self.finalized_end = segment['end']
+            self.finalized_count += 1
+            new_finalized.append(segment)
+            self._write_spill(segment)
+
+        raw_pending = raw_segments[-1] if raw_segments and not raw_segments[-1].get('completed') else None
+        changed_pending = None
+        if raw_pending is not None:
+            pending = self.pending
+            end = float(raw_pending['end'])
+            if pending is None or pending['text'] != raw_pending['text'] or pending['end'] != end:
+                self.pending = changed_pending = parse_segment(raw_pending)
+        elif raw_segments:
+            self.pending = None
+
+        return new_finalized, changed_pending
+
+    def _write_spill(self, segment: dict):
+        if not self.spill_path:
+            return
+        if self._spill is None:
+            self._spill = open(self.spill_path, 'a', encoding='utf-8', buffering=1)
+        self._spill.write(json.dumps(segment, ensure_ascii=False) + "\n")
+
+    def close(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+
+class SegmentRecorder:
+    def __init__(self, path: str):
+        self.path = path
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._file = open(path, 'w', encoding='utf-8', buffering=1)
+
+    def record(self, segments: list, arrived: Optional[float] = None):
+        arrived = time.monotonic() if arrived is None else arrived
+        line = json.dumps({'t': round(arrived - self.started, 4), 'segments': segments}, ensure_ascii=False)
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
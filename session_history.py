@@ -0,0 +1,197 @@
+import json
+import queue
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from fuzzy_match import HIGH_CONFIDENCE
+from normalization import normalize_word
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    student TEXT NOT NULL,
+    passage_id INTEGER,
+    passage_title TEXT,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    accuracy REAL NOT NULL,
+    words_per_minute REAL NOT NULL,
+    word_count INTEGER NOT NULL,
+    problem_words TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_student ON sessions(student, started_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_passage ON sessions(passage_id, started_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions(started_at);
+CREATE TABLE IF NOT EXISTS student_progress (
+    student TEXT PRIMARY KEY,
+    sessions INTEGER NOT NULL,
+    accuracy_sum REAL NOT NULL,
+    words_per_minute_sum REAL NOT NULL,
+    best_accuracy REAL NOT NULL,
+    first_at REAL NOT NULL,
+    last_at REAL NOT NULL,
+    last_accuracy REAL NOT NULL,
+    last_words_per_minute REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS problem_words (
+    student TEXT NOT NULL,
+    word TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    last_at REAL NOT NULL,
+    PRIMARY KEY (student, word)
+);
+CREATE INDEX IF NOT EXISTS idx_problem_words_count ON problem_words(student, count);
+"""
+
+
+def problem_words(analysis: dict) -> List[str]:
+    words = [normalize_word(w['word']) for w in analysis.get('word_confidence', [])
+             if w['spoken'] is not None and w['score'] < HIGH_CONFIDENCE]
+    return [w for w in words if w]
+
+
+def session_record(student: str, analysis: dict, started_at: float, duration: float,
+                   passage: Optional[dict] = None) -> dict:
+    return {
+        'student': student,
+        'passage_id': passage['id'] if passage else None,
+        'passage_title': passage['title'] if passage else None,
+        'started_at': started_at,
+        'duration': round(duration, 2),
+        'accuracy': round(analysis['accuracy'], 2),
+        'words_per_minute': round(analysis['reading_speed'], 2),
+        'word_count': len(analysis.get('word_confidence', [])),
+        'problem_words': problem_words(analysis)
+    }
+
+
+class SessionHistory:
+    def __init__(self, path: str = 'history.db', max_pending: int = 256):
+        self.path = path
+        self.queue: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=max_pending)
+        self.dropped = 0
+        self.written = 0
+
+        self._reader = self._connect()
+        self._reader.executescript(SCHEMA)
+        self._writer = threading.Thread(target=self._run, daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        db.row_factory = sqlite3.Row
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def submit(self, record: dict) -> bool:
+        try:
+            self.queue.put_nowait(record)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _run(self):
+        db = self._connect()
+        while True:
+            batch = [self.queue.get()]
+            while batch[-1] is not None:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [record for record in batch if record is not None]
+            if records:
+                try:
+                    with db:
+                        for record in records:
+                            self._write(db, record)
+                    self.written += len(records)
+                except sqlite3.Error as e:
+                    self.dropped += len(records)
+                    print(f"Oturum kaydedilemedi: {e}")
+            for _ in batch:
+                self.queue.task_done()
+            if batch[-1] is None:
+                break
+        db.close()
+
+    @staticmethod
+    def _write(db, record: dict):
+        db.execute(
+            "INSERT INTO sessions (student, passage_id, passage_title, started_at, duration, accuracy, "
+            "words_per_minute, word_count, problem_words) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (record['student'], record['passage_id'], record['passage_title'], record['started_at'],
+             record['duration'], record['accuracy'], record['words_per_minute'], record['word_count'],
+             json.dumps(record['problem_words'], ensure_ascii=False))
+        )
+        db.execute(
+            "INSERT INTO student_progress VALUES (?, 1, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(student) DO UPDATE SET "
+            "sessions = sessions + 1, "
+            "accuracy_sum = accuracy_sum + excluded.accuracy_sum, "
+            "words_per_minute_sum = words_per_minute_sum + excluded.words_per_minute_sum, "
+            "best_accuracy = MAX(best_accuracy, excluded.best_accuracy), "
+            "last_at = excluded.last_at, "
+            "last_accuracy = excluded.last_accuracy, "
+            "last_words_per_minute = excluded.last_words_per_minute",
+            (record['student'], record['accuracy'], record['words_per_minute'], record['accuracy'],
+             record['started_at'], record['started_at'], record['accuracy'], record['words_per_minute'])
+        )
+        counts = {}
+        for word in record['problem_words']:
+            counts[word] = counts.get(word, 0) + 1
+        db.executemany(
+            "INSERT INTO problem_words VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(student, word) DO UPDATE SET count = count + excluded.count, last_at = excluded.last_at",
+            [(record['student'], word, count, record['started_at']) for word, count in counts.items()]
+        )
+
+    def progress(self, student: str, top_words: int = 10) -> Optional[dict]:
+        row = self._reader.execute("SELECT * FROM student_progress WHERE student = ?", (student,)).fetchone()
+        if row is None:
+            return None
+        progress = dict(row)
+        progress['average_accuracy'] = progress['accuracy_sum'] / progress['sessions']
+        progress['average_words_per_minute'] = progress['words_per_minute_sum'] / progress['sessions']
+        progress['problem_words'] = [
+            (r['word'], r['count']) for r in self._reader.execute(
+                "SELECT word, count FROM problem_words WHERE student = ? ORDER BY count DESC LIMIT ?",
+                (student, top_words)
+            )
+        ]
+        return progress
+
+    def recent(self, student: str, limit: int = 10, passage_id: Optional[int] = None) -> List[dict]:
+        if passage_id is None:
+            rows = self._reader.execute(
+                "SELECT * FROM sessions WHERE student = ? ORDER BY started_at DESC LIMIT ?", (student, limit)
+            )
+        else:
+            rows = self._reader.execute(
+                "SELECT * FROM sessions WHERE passage_id = ? AND student = ? ORDER BY started_at DESC LIMIT ?",
+                (passage_id, student, limit)
+            )
+        sessions = []
+        for row in rows:
+            session = dict(row)
+            session['problem_words'] = json.loads(session['problem_words'])
+            sessions.append(session)
+        return sessions
+
+    def flush(self, timeout: float = 5.0):
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def close(self, timeout: float = 5.0):
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._writer.join(timeout)
+        self._reader.close()
@@ -0,0 +1,121 @@
+import argparse
+import json
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from websockets.exceptions import ConnectionClosed
+from websockets.sync.server import serve
+
+
+END_OF_AUDIO = b"END_OF_AUDIO"
+
+
+def load_script(path: str) -> List[Tuple[float, list]]:
+    messages = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                message = json.loads(line)
+                messages.append((float(message.get('t', 0.0)), message['segments']))
+    return messages
+
+
+class StandInServer:
+    def __init__(self, script: List[Tuple[float, list]], host: str = 'localhost', port: int = 9090,
+                 frames_per_message: int = 4, speed: Optional[float] = None, backend: str = 'faster_whisper'):
+        self.script = script
+        self.host = host
+        self.port = port
+        self.frames_per_message = frames_per_message
+        self.speed = speed
+        self.backend = backend
+        self.sessions = 0
+        self._server = None
+        self._started = threading.Event()
+
+    def handle(self, websocket):
+        options = json.loads(websocket.recv())
+        uid = options['uid']
+        websocket.send(json.dumps({'uid': uid, 'message': 'SERVER_READY', 'backend': self.backend}))
+        self.sessions += 1
+
+        try:
+            if self.speed is None:
+                self._reply_to_audio(websocket, uid)
+            else:
+                self._replay_timed(websocket, uid)
+            websocket.send(json.dumps({'uid': uid, 'message': 'DISCONNECT'}))
+        except ConnectionClosed:
+            pass
+
+    def _reply_to_audio(self, websocket, uid):
+        sent = 0
+        frames = 0
+        for message in websocket:
+            if message == END_OF_AUDIO:
+                break
+            frames += 1
+            if frames % self.frames_per_message == 0 and sent < len(self.script):
+                websocket.send(json.dumps({'uid': uid, 'segments': self.script[sent][1]}))
+                sent += 1
+
+        for _, segments in self.script[sent:]:
+            websocket.send(json.dumps({'uid': uid, 'segments': segments}))
+
+    def _replay_timed(self, websocket, uid):
+        def drain():
+            try:
+                for message in websocket:
+                    if message == END_OF_AUDIO:
+                        break
+            except Exception:
+                pass
+
+        threading.Thread(target=drain, daemon=True).start()
+
+        started = time.monotonic()
+        first = self.script[0][0] if self.script else 0.0
+        for t, segments in self.script:
+            if self.speed > 0:
+                delay = started + (t - first) / self.speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            websocket.send(json.dumps({'uid': uid, 'segments': segments}))
+
+    def serve_forever(self):
+        with serve(self.handle, self.host, self.port) as server:
+            self._server = server
+            self.port = server.socket.getsockname()[1]
+            self._started.set()
+            server.serve_forever()
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        self._started.wait()
+        return thread
+
+    def shutdown(self):
+        if self._server:
+            self._server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local whisper-live stand-in server')
+    parser.add_argument('script', help='JSONL file with one {"t", "segments": [...]} server message per line')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=9090)
+    parser.add_argument('--frames-per-message', type=int, default=4)
+    parser.add_argument('--speed', type=float,
+                        help='replay recorded timing at this speed (1 = real time, 0 = as fast as possible); '
+                             'without it, one message is sent per --frames-per-message audio frames')
+    args = parser.parse_args()
+
+    server = StandInServer(load_script(args.script), args.host, args.port, args.frames_per_message, args.speed)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import random
+
+from alignment import MATCH, TokenVocabulary, _align_block, align_words
+
+FUNCTION_WORDS = "ve bir bu da de ile için çok".split()
+CONTENT_WORDS = ("kedi bahçede oyun oynuyor renkli kelebek gördü peşinden koştu ali okula giderken yolda "
+                 "arkadaşı ayşe birlikte yürümeye başladılar hava güzeldi kuşlar ötüyordu annem sandviç "
+                 "hazırlamıştı kardeşim top oynamak istedi beraber oynadık geçen hafta sonu ailemle pikniğe "
+                 "gittik yeşil çimenlerin üzerine battaniyemizi serdik lezzetli sabah erken kalktı kahvaltı "
+                 "yaptı çantasını aldı otobüse bindi öğretmen sınıfa girdi kitap açtı").split()
+
+
+def skipped_line_reading(seed: int, skip: int = 15, length: int = 120):
+    rng = random.Random(seed)
+    reference = [rng.choice(FUNCTION_WORDS) if rng.random() < 0.45 else rng.choice(CONTENT_WORDS)
+                 for _ in range(length)]
+    spoken = []
+    for index, word in enumerate(reference):
+        if 40 <= index < 40 + skip:
+            continue
+        roll = rng.random()
+        if roll < 0.08:
+            spoken.append(word + 'ı')
+        elif roll < 0.12:
+            continue
+        elif roll < 0.15:
+            spoken.extend((word, word))
+        else:
+            spoken.append(word)
+    return reference, spoken
+
+
+def optimal_matches(ref_ids, spoken_ids) -> int:
+    ops = []
+    _align_block(ref_ids, spoken_ids, 0, 0, ops)
+    return sum(op == MATCH for op, _, _ in ops)
+
+
+def test_skipped_line_matches_optimal_alignment():
+    for seed in range(50):
+        reference, spoken = skipped_line_reading(seed)
+        vocabulary = TokenVocabulary()
+        ref_ids, spoken_ids = vocabulary.encode(reference), vocabulary.encode(spoken)
+        assert align_words(ref_ids, spoken_ids)['matches'] >= optimal_matches(ref_ids, spoken_ids) - 2
+
+
+def test_skip_longer_than_band_only_loses_skipped_words():
+    reference = [f"kelime{i}" for i in range(1000)]
+    spoken = reference[:400] + reference[420:]
+    vocabulary = TokenVocabulary()
+    result = align_words(vocabulary.encode(reference), vocabulary.encode(spoken))
+    assert result['matches'] == 980
+    assert result['omissions'] == list(range(400, 420))
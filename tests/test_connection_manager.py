@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+from connection_manager import ConnectionManager
+from reading_session import ReadingSession
+from segment_store import SegmentStore
+
+
+def connect(manager, audio_seconds_sent):
+    store = SegmentStore()
+    manager.client = SimpleNamespace(client=SimpleNamespace(segment_store=store, audio_seconds_sent=audio_seconds_sent))
+    return store
+
+
+def receive(manager, store, segments):
+    finalized, pending = store.update(segments)
+    manager._dispatch(finalized, pending)
+
+
+def test_reconnect_continues_the_session_timeline():
+    session = ReadingSession("Küçük kedi bahçede oyun oynuyor".split())
+    manager = ConnectionManager({})
+    manager.attach(session.handle_transcript)
+
+    store = connect(manager, 600.0)
+    receive(manager, store, [{'start': '598.0', 'end': '599.5', 'text': 'Küçük kedi', 'completed': False}])
+    manager._end_connection()
+
+    assert session.pending_segment is None
+    assert [s['text'] for s in session.all_segments] == ['Küçük kedi']
+
+    store = connect(manager, 2.0)
+    receive(manager, store, [{'start': '0.5', 'end': '1.5', 'text': 'bahçede oyun', 'completed': False,
+                              'words': [{'word': 'bahçede', 'start': '0.5', 'end': '1.0'},
+                                        {'word': 'oyun', 'start': '1.0', 'end': '1.5'}]}])
+
+    assert session.pending_segment['start'] == 600.5
+    assert [w['start'] for w in session.pending_segment['words']] == [600.5, 601.0]
+    assert [s['text'] for s in session.finish()] == ['Küçük kedi', 'bahçede oyun']
@@ -0,0 +1,34 @@
+from hallucination_filter import HallucinationFilter, IncrementalFilter
+
+
+def test_blocklisted_phrases_and_their_imperatives_are_stripped():
+    cleaner = HallucinationFilter()
+
+    assert cleaner.clean("kedi koştu Abone olmayı unutmayın.") == "kedi koştu"
+    assert cleaner.clean("kedi koştu Abone olmayı unutmayınız!") == "kedi koştu"
+    assert cleaner.clean("kedi koştu abone olun") == "kedi koştu"
+    assert cleaner.clean("İzlediğiniz için teşekkür ederim.") == ""
+
+
+def test_legitimate_words_sharing_a_phrase_prefix_survive():
+    cleaner = HallucinationFilter()
+
+    assert cleaner.clean("Ali dergiye abone olmak istedi.") == "Ali dergiye abone olmak istedi."
+    assert cleaner.clean("Abone olduğu dergi geldi.") == "Abone olduğu dergi geldi."
+    assert cleaner.clean("Abone olmayı unutmadı.") == "Abone olmayı unutmadı."
+
+
+def test_single_word_phrase_only_matches_the_whole_word():
+    cleaner = HallucinationFilter(["kedi"])
+
+    assert cleaner.clean("kediler kedicik kedi koştu") == "kediler kedicik koştu"
+
+
+def test_incremental_filter_agrees_with_full_clean():
+    cleaner = HallucinationFilter()
+    incremental = IncrementalFilter(cleaner)
+    words = "Ali dergiye abone olmak istedi abone olun".split()
+
+    for end in range(1, len(words) + 1):
+        text = " ".join(words[:end])
+        assert incremental.clean(0.0, text) == cleaner.clean(text)
@@ -0,0 +1,21 @@
+from reading_analysis import analyze_reading
+
+
+def test_fillers_and_repeats_are_not_reported_as_extra_words():
+    reference = "Küçük kedi bahçede oyun oynuyor".split()
+    segments = [{'start': 0.0, 'end': 6.0, 'text': 'Küçük ııı kedi kedi ba ba bahçede oyun oynuyor'}]
+
+    analysis = analyze_reading(segments, reference)
+
+    assert [event['type'] for event in analysis['hesitations']] == ['dolgu', 'tekrar', 'tekrar', 'hece tekrarı']
+    assert analysis['misreadings'] == []
+    assert analysis['accuracy'] == 100.0
+
+
+def test_extra_words_outside_hesitations_are_still_reported():
+    reference = "Küçük kedi bahçede oyun oynuyor".split()
+    segments = [{'start': 0.0, 'end': 4.0, 'text': 'Küçük ııı kedi bahçede güzel oyun oynuyor'}]
+
+    analysis = analyze_reading(segments, reference)
+
+    assert [(m['spoken'], m['reference']) for m in analysis['misreadings']] == [('güzel', None)]
@@ -0,0 +1,12 @@
+from reading_analysis import analyze_reading
+from session_history import problem_words, session_record
+
+
+def test_early_stop_keeps_unread_words_out_of_problem_words():
+    reference = "Küçük kedi bahçede oyun oynuyor. Renkli bir kelebek gördü ve peşinden koştu.".split()
+    segments = [{'start': 0.0, 'end': 2.0, 'text': 'Küçük kedi bahçade oyun'}]
+
+    analysis = analyze_reading(segments, reference)
+
+    assert problem_words(analysis) == ['bahçede']
+    assert session_record('Ali', analysis, 0.0, 2.0)['problem_words'] == ['bahçede']
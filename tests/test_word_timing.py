@@ -0,0 +1,21 @@
+import numpy as np
+
+from alignment import MATCH
+from word_timing import WordTimeline
+
+
+def timeline(starts, ends):
+    ops = [(MATCH, i, i) for i in range(len(starts))]
+    return WordTimeline.from_alignment(np.asarray(starts, dtype=float), np.asarray(ends, dtype=float), ops)
+
+
+def test_rolling_wpm_is_empty_when_the_reading_is_shorter_than_the_window():
+    assert timeline([1.0], [1.0]).rolling_wpm() == []
+    assert timeline([0.0, 1.0, 2.0], [1.0, 2.0, 3.0]).rolling_wpm(window=10.0) == []
+
+
+def test_rolling_wpm_counts_words_finished_in_each_full_window():
+    starts = np.arange(20, dtype=float)
+    rolling = timeline(starts, starts + 1.0).rolling_wpm(window=10.0, step=5.0)
+
+    assert rolling == [(10.0, 60.0), (15.0, 60.0), (20.0, 60.0)]
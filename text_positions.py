@@ -0,0 +1,24 @@
+import re
+from typing import List, Tuple
+
+_TOKEN_RE = re.compile(r'\S+')
+
+
+def build_token_index(text: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+    tokens, positions = [], []
+    line, line_start, scanned = 1, 0, 0
+
+    for match in _TOKEN_RE.finditer(text):
+        start = match.start()
+        newlines = text.count('\n', scanned, start)
+        if newlines:
+            line += newlines
+            line_start = text.rfind('\n', scanned, start) + 1
+        scanned = start
+
+        word = match.group()
+        col = start - line_start
+        tokens.append(word)
+        positions.append((f"{line}.{col}", f"{line}.{col + len(word)}"))
+
+    return tokens, positions
@@ -0,0 +1,186 @@
+import argparse
+import bisect
+import json
+import wave
+from typing import List, Tuple
+
+import numpy as np
+
+
+class SpeechTimeline:
+    def __init__(self):
+        self.sent = [0.0]
+        self.real = [0.0]
+
+    def add_gap(self, sent_time: float, real_time: float):
+        if real_time - sent_time <= self.real[-1] - self.sent[-1]:
+            return
+        if len(self.sent) > 1 and self.sent[-1] == sent_time:
+            self.real[-1] = real_time
+        else:
+            self.sent.append(sent_time)
+            self.real.append(real_time)
+
+    def to_real(self, t: float, is_end: bool = False) -> float:
+        if len(self.sent) == 1:
+            return t
+        find = bisect.bisect_left if is_end else bisect.bisect_right
+        i = max(find(self.sent, t) - 1, 0)
+        return self.real[i] + t - self.sent[i]
+
+    def restore(self, segments: List[dict]) -> List[dict]:
+        if len(self.sent) == 1:
+            return segments
+        return [self._restore(s) for s in segments]
+
+    def _restore(self, segment: dict) -> dict:
+        restored = dict(segment, start=self.to_real(float(segment['start'])),
+                        end=self.to_real(float(segment['end']), is_end=True))
+        if segment.get('words'):
+            restored['words'] = [
+                dict(w, start=self.to_real(float(w['start'])), end=self.to_real(float(w['end']), is_end=True))
+                for w in segment['words']
+            ]
+        return restored
+
+
+class VoiceGate:
+    def __init__(self, rate: int = 16000, frame_ms: int = 16, threshold: float = 0.01, zcr_threshold: float = 0.25,
+                 noise_ratio: float = 3.0, hangover_ms: int = 400, preroll_ms: int = 200):
+        self.rate = rate
+        self.frame = rate * frame_ms // 1000
+        self.threshold = threshold
+        self.zcr_threshold = zcr_threshold
+        self.noise_ratio = noise_ratio
+        self.hangover = max(hangover_ms // frame_ms, 1)
+        self.preroll = preroll_ms * rate // 1000
+
+        self.noise_floor = threshold / noise_ratio
+        self.timeline = SpeechTimeline()
+        self.samples_in = 0
+        self.samples_out = 0
+        self._since_speech = self.hangover + 1
+        self._held = np.zeros(0, dtype=np.float32)
+
+    @property
+    def bytes_in(self) -> int:
+        return self.samples_in * 4
+
+    @property
+    def bytes_out(self) -> int:
+        return self.samples_out * 4
+
+    def saved_ratio(self) -> float:
+        return 1.0 - self.samples_out / self.samples_in if self.samples_in else 0.0
+
+    def classify(self, samples: np.ndarray) -> np.ndarray:
+        count = -(-len(samples) // self.frame)
+        frames = np.zeros(count * self.frame, dtype=np.float32)
+        frames[:len(samples)] = samples
+        frames = frames.reshape(count, self.frame)
+        lengths = np.full(count, self.frame)
+        lengths[-1] = len(samples) - (count - 1) * self.frame
+
+        rms = np.sqrt(np.einsum('ij,ij->i', frames, frames) / lengths)
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / lengths
+
+        threshold = max(self.threshold, self.noise_floor * self.noise_ratio)
+        speech = (rms > threshold) | ((rms > threshold / 2) & (zcr > self.zcr_threshold))
+
+        quiet = rms[~speech]
+        if len(quiet):
+            self.noise_floor = 0.9 * self.noise_floor + 0.1 * float(np.median(quiet))
+        return speech
+
+    def active_frames(self, speech: np.ndarray) -> np.ndarray:
+        positions = np.arange(len(speech))
+        last = np.where(speech, positions, -self._since_speech)
+        np.maximum.accumulate(last, out=last)
+        since = positions - last
+        self._since_speech = min(int(since[-1]) + 1, self.hangover + 1)
+        return since <= self.hangover
+
+    def filter(self, samples: np.ndarray) -> np.ndarray:
+        if not len(samples):
+            return samples
+        start = self.samples_in
+        self.samples_in += len(samples)
+        active = np.repeat(self.active_frames(self.classify(samples)), self.frame)[:len(samples)]
+
+        if active.all() and not len(self._held):
+            self.samples_out += len(samples)
+            return samples
+
+        pieces = []
+        edges = np.flatnonzero(np.diff(active.astype(np.int8))) + 1
+        bounds = np.concatenate(([0], edges, [len(samples)]))
+        bounds = bounds.tolist()
+        for begin, end in zip(bounds[:-1], bounds[1:]):
+            if active[begin]:
+                if len(self._held):
+                    pieces.append(self._held)
+                    self.samples_out += len(self._held)
+                    self._held = self._held[:0]
+                pieces.append(samples[begin:end])
+                self.samples_out += end - begin
+            else:
+                self._hold(samples[begin:end], start + begin)
+        return np.concatenate(pieces) if pieces else samples[:0]
+
+    def _hold(self, silence: np.ndarray, position: int):
+        held = np.concatenate((self._held, silence)) if len(self._held) else silence
+        if len(held) > self.preroll:
+            held = held[len(held) - self.preroll:]
+        self._held = held
+        skipped_until = position + len(silence) - len(held)
+        self.timeline.add_gap(self.samples_out / self.rate, skipped_until / self.rate)
+
+    def filter_bytes(self, packet: bytes) -> bytes:
+        return self.filter(np.frombuffer(packet, dtype=np.float32)).tobytes()
+
+    def summary(self) -> dict:
+        return {
+            'seconds_in': round(self.samples_in / self.rate, 3),
+            'seconds_out': round(self.samples_out / self.rate, 3),
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'saved_ratio': round(self.saved_ratio(), 4),
+            'gaps': len(self.timeline.sent) - 1
+        }
+
+
+def read_wav(path: str) -> Tuple[np.ndarray, int]:
+    with wave.open(path, 'rb') as wav:
+        if wav.getsampwidth() != 2 or wav.getnchannels() != 1:
+            raise ValueError(f"{path}: 16-bit mono WAV bekleniyor")
+        rate = wav.getframerate()
+        data = wav.readframes(wav.getnframes())
+    return np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0, rate
+
+
+def gate_wav(path: str, chunk: int = 4096, **options) -> dict:
+    samples, rate = read_wav(path)
+    gate = VoiceGate(rate, **options)
+    sent = [gate.filter(samples[i:i + chunk]) for i in range(0, len(samples), chunk)]
+    result = gate.summary()
+    result['timeline'] = list(zip(gate.timeline.sent, gate.timeline.real))
+    result['sent_samples'] = sum(len(s) for s in sent)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the client-side voice gate over a WAV file offline')
+    parser.add_argument('wav', nargs='+', help='16-bit mono WAV files')
+    parser.add_argument('--threshold', type=float, default=0.01)
+    parser.add_argument('--hangover-ms', type=int, default=400)
+    args = parser.parse_args()
+
+    for path in args.wav:
+        result = gate_wav(path, threshold=args.threshold, hangover_ms=args.hangover_ms)
+        result.pop('timeline')
+        print(json.dumps(dict(result, file=path), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
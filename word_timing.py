@@ -0,0 +1,125 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from alignment import MATCH, SUBSTITUTION
+from normalization import normalize_text, normalize_word
+
+PAUSE_BINS = (0.25, 0.5, 1.0, 2.0, 4.0)
+
+
+def timed_words(segments: Sequence[dict]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    words, starts, ends = [], [], []
+    for segment in segments:
+        spoken = normalize_text(segment['text'])
+        if not spoken:
+            continue
+        timed = segment.get('words') or ()
+        if len(timed) != len(spoken):
+            timed = [w for w in timed if normalize_word(w['word'].strip())]
+        if len(timed) == len(spoken):
+            starts.extend(float(w['start']) for w in timed)
+            ends.extend(float(w['end']) for w in timed)
+        else:
+            edges = np.linspace(float(segment['start']), float(segment['end']), len(spoken) + 1)
+            starts.extend(edges[:-1].tolist())
+            ends.extend(edges[1:].tolist())
+        words.extend(spoken)
+    return words, np.asarray(starts, dtype=np.float64), np.asarray(ends, dtype=np.float64)
+
+
+class WordTimeline:
+    def __init__(self, start: np.ndarray, end: np.ndarray, ref_index: np.ndarray, correct: np.ndarray):
+        self.start = start
+        self.end = end
+        self.ref_index = ref_index
+        self.correct = correct
+
+    @classmethod
+    def from_alignment(cls, start: np.ndarray, end: np.ndarray, ops) -> 'WordTimeline':
+        ref_index = np.full(len(start), -1, dtype=np.int32)
+        correct = np.zeros(len(start), dtype=bool)
+        paired = [(ref, spoken, op == MATCH) for op, ref, spoken in ops if op == MATCH or op == SUBSTITUTION]
+        if paired:
+            refs, spoken, matched = zip(*paired)
+            spoken = np.asarray(spoken, dtype=np.intp)
+            ref_index[spoken] = refs
+            correct[spoken] = matched
+        return cls(start, end, ref_index, correct)
+
+    def __len__(self):
+        return len(self.start)
+
+    def gaps(self) -> np.ndarray:
+        if len(self) < 2:
+            return np.zeros(0)
+        return np.maximum(self.start[1:] - self.end[:-1], 0.0)
+
+    def pause_distribution(self, threshold: float = PAUSE_BINS[0]) -> dict:
+        gaps = self.gaps()
+        pauses = gaps[gaps >= threshold]
+        counts = np.histogram(pauses, bins=(*PAUSE_BINS, np.inf))[0]
+        labels = [f"{low:g}-{high:g}s" for low, high in zip(PAUSE_BINS, PAUSE_BINS[1:])] + [f">{PAUSE_BINS[-1]:g}s"]
+        return {
+            'count': int(len(pauses)),
+            'total': round(float(pauses.sum()), 2),
+            'median': round(float(np.median(pauses)), 2) if len(pauses) else 0.0,
+            'p90': round(float(np.percentile(pauses, 90)), 2) if len(pauses) else 0.0,
+            'bins': dict(zip(labels, counts.tolist()))
+        }
+
+    def correct_words_per_minute(self) -> float:
+        if len(self) < 1:
+            return 0.0
+        duration = float(self.end[-1] - self.start[0])
+        return float(np.count_nonzero(self.correct)) / (duration / 60) if duration > 0 else 0.0
+
+    def rolling_wpm(self, window: float = 10.0, step: float = 5.0) -> List[Tuple[float, float]]:
+        if not len(self):
+            return []
+        origin = float(self.start[0])
+        if float(self.end[-1]) - origin < window:
+            return []
+        done = np.sort(self.end[self.correct])
+        grid = np.arange(origin + window, float(self.end[-1]) + step, step)
+        counts = np.searchsorted(done, grid, side='right') - np.searchsorted(done, grid - window, side='right')
+        return list(zip(np.round(grid - origin, 1).tolist(), np.round(counts * 60 / window, 1).tolist()))
+
+    def dwell(self, ref_length: int) -> np.ndarray:
+        valid = self.ref_index >= 0
+        return np.bincount(self.ref_index[valid], weights=(self.end - self.start)[valid], minlength=ref_length)
+
+    def hesitation_before(self, ref_length: int) -> np.ndarray:
+        before = np.zeros(len(self))
+        before[1:] = self.gaps()
+        valid = self.ref_index >= 0
+        refs, first = np.unique(self.ref_index[valid], return_index=True)
+        hesitation = np.zeros(ref_length)
+        hesitation[refs] = before[np.flatnonzero(valid)[first]]
+        return hesitation
+
+
+def timing_report(timeline: WordTimeline, reference_words: Sequence[str], positions: Sequence[int] = None,
+                  top: int = 5) -> dict:
+    ref_length = len(reference_words)
+    positions = positions if positions is not None else range(ref_length)
+    dwell = timeline.dwell(ref_length)
+    hesitation = timeline.hesitation_before(ref_length)
+    lengths = np.maximum(np.fromiter(map(len, reference_words), dtype=np.float64, count=ref_length), 1)
+
+    def ranked(values: np.ndarray, scale: np.ndarray = None, minimum: float = 0.0):
+        score = values / scale if scale is not None else values
+        order = np.argsort(-score, kind='stable')[:top]
+        return [{'index': positions[i], 'word': reference_words[i], 'seconds': round(float(values[i]), 2)}
+                for i in order.tolist() if values[i] > minimum]
+
+    read = dwell > 0
+    return {
+        'correct_words_per_minute': round(timeline.correct_words_per_minute(), 1),
+        'pauses': timeline.pause_distribution(),
+        'rolling_wpm': timeline.rolling_wpm(),
+        'mean_dwell': round(float(dwell[read].mean()), 3) if read.any() else 0.0,
+        'mean_hesitation': round(float(hesitation[read].mean()), 3) if read.any() else 0.0,
+        'slowest_words': ranked(dwell, lengths),
+        'hesitation_words': ranked(hesitation, minimum=PAUSE_BINS[0])
+    }